@@ -190,7 +190,7 @@ async def synthesize(request: SynthesizeRequest):
     """
     try:
         # Synthesize speech
-        audio_path = await orchestrator_service.synthesize_speech(
+        audio_path = await orchestrator_service.synthesize_to_file(
             text=request.text,
             style=request.style,
             pitch=request.pitch,
@@ -210,6 +210,46 @@ async def synthesize(request: SynthesizeRequest):
         raise HTTPException(status_code=500, detail=f"Speech synthesis failed: {str(e)}")
 
 
+@router.post("/synthesize/stream")
+async def synthesize_stream(request: SynthesizeRequest):
+    """
+    Synthesize speech and stream the audio as it is generated.
+    
+    Args:
+        request: Synthesis request with text and optional style/prosody
+        
+    Returns:
+        Streaming WAV audio
+    """
+    audio_stream = orchestrator_service.synthesize_speech(
+        text=request.text,
+        style=request.style,
+        pitch=request.pitch,
+        rate=request.rate,
+        voice_gender=request.voice_gender
+    )
+    
+    try:
+        # Pull the first chunk eagerly so synthesis errors map to a 500
+        first_chunk = await audio_stream.__anext__()
+    except StopAsyncIteration:
+        first_chunk = b""
+    except Exception as e:
+        logger.error(f"Speech synthesis failed: {e}")
+        raise HTTPException(status_code=500, detail=f"Speech synthesis failed: {str(e)}")
+    
+    async def body():
+        try:
+            if first_chunk:
+                yield first_chunk
+            async for chunk in audio_stream:
+                yield chunk
+        finally:
+            await audio_stream.aclose()
+    
+    return StreamingResponse(body(), media_type="audio/wav")
+
+
 @router.get("/audio/{filename}")
 async def get_audio(filename: str):
     """
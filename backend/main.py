@@ -21,6 +21,7 @@ load_dotenv(dotenv_path=env_path)
 
 from backend.api.routes import router
 from backend.api.simulation_routes import router as simulation_router
+from backend.services.orchestrator_service import orchestrator_service
 
 # Configure logging
 logging.basicConfig(
@@ -82,6 +83,7 @@ app.include_router(simulation_router, dependencies=[Depends(get_api_key)])
 async def startup_event():
     """Run on application startup."""
     logger.info("Starting ConversaVoice API...")
+    await orchestrator_service.start()
     logger.info(f"API Documentation available at: http://localhost:8000/docs")
 
 
@@ -89,6 +91,7 @@ async def startup_event():
 async def shutdown_event():
     """Run on application shutdown."""
     logger.info("Shutting down ConversaVoice API...")
+    await orchestrator_service.stop()
 
 
 @app.get("/")
@@ -2,37 +2,261 @@
 
 import os
 import sys
+import time
+import uuid
+import urllib.parse
 import asyncio
 import logging
-from typing import Dict, Optional
+import threading
+from collections import OrderedDict, defaultdict
+from typing import AsyncIterator, Dict, Iterator, Optional, Set
 from pathlib import Path
 
 # Add parent directory to path to import src modules
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
+import requests
+
 from src.orchestrator import Orchestrator, PipelineResult
+from src.fallback import ServiceType
 
 logger = logging.getLogger(__name__)
 
 
 UPLOADS_DIR = "uploads"
 GENERATED_AUDIO_DIR = "generated_audio"
+# Short-lived upload copies live on tmpfs when available
+SCRATCH_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else UPLOADS_DIR
+STREAM_CHUNK_SIZE = 16 * 1024
+# Chunks a streaming synthesis may read ahead of the client
+STREAM_PREFETCH = 8
+
+# Session pool limits
+MAX_SESSIONS = 128
+SESSION_TTL_SECONDS = 1800
+WARM_POOL_SIZE = 4
+
+# Dynamic batching of TTS requests
+TTS_MAX_BATCH = 8
+TTS_MAX_WAIT_MS = 5
+
+def _voice_for_gender(tts_client, voice_gender: Optional[str]) -> Optional[str]:
+    """Voice name for a per-call gender override, or None to keep the client's voice."""
+    builder = getattr(tts_client, "ssml_builder", None)
+    if not voice_gender or builder is None:
+        return None
+    return builder.DEFAULT_MALE_VOICE if voice_gender == "male" else builder.DEFAULT_FEMALE_VOICE
+
+
+async def _iterate_in_thread(chunks: Iterator[bytes]) -> AsyncIterator[bytes]:
+    """
+    Drive a blocking chunk generator from one dedicated thread.
+
+    The generator is advanced and closed on that same thread, so stopping
+    early (e.g. the client disconnected) never closes it while a read is
+    in progress. At most STREAM_PREFETCH chunks are buffered ahead.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    stop = threading.Event()
+    slots = threading.Semaphore(STREAM_PREFETCH)
+    end = object()
+
+    def deliver(item) -> None:
+        try:
+            loop.call_soon_threadsafe(queue.put_nowait, item)
+        except RuntimeError:
+            pass  # loop already closed
+
+    def produce() -> None:
+        try:
+            for chunk in chunks:
+                while not slots.acquire(timeout=0.1):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                deliver(chunk)
+            deliver(end)
+        except Exception as e:
+            deliver(e)
+        finally:
+            chunks.close()
+
+    threading.Thread(target=produce, name="tts-stream", daemon=True).start()
+    try:
+        while True:
+            item = await queue.get()
+            if item is end:
+                return
+            if isinstance(item, Exception):
+                raise item
+            slots.release()
+            yield item
+    finally:
+        stop.set()
+
 
 class OrchestratorService:
     """
     Service layer for managing orchestrator instances.
     
-    Maintains a pool of orchestrator instances per session.
+    Maintains a bounded LRU pool of orchestrator instances per session.
+    Idle sessions expire after SESSION_TTL_SECONDS and are shut down, and a
+    small warm pool of pre-initialized orchestrators keeps client setup off
+    the request path for new sessions.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        max_sessions: int = MAX_SESSIONS,
+        session_ttl: float = SESSION_TTL_SECONDS,
+        warm_pool_size: int = WARM_POOL_SIZE
+    ):
         """Initialize the orchestrator service."""
-        self._orchestrators: Dict[str, Orchestrator] = {}
-        self._lock = asyncio.Lock()
+        self.max_sessions = max_sessions
+        self.session_ttl = session_ttl
+        self.warm_pool_size = warm_pool_size
+        self._orchestrators: "OrderedDict[str, Orchestrator]" = OrderedDict()
+        self._last_used: Dict[str, float] = {}
+        # Per-session locks so slow initialization of one session never
+        # blocks another; the dicts themselves are only touched from the loop
+        self._locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._warm: Optional[asyncio.Queue] = None
+        self._warm_task: Optional[asyncio.Task] = None
+        self._background_tasks: Set[asyncio.Task] = set()
+        # Dynamic batching of synthesis requests
+        self._tts_queue: Optional[asyncio.Queue] = None
+        self._tts_worker: Optional[asyncio.Task] = None
+        self._tts_batches: Set[asyncio.Task] = set()
         # Task 19: Audio synthesis cache
         self._audio_cache: Dict[str, str] = {}
+        # Service health, updated as real orchestrators initialize and
+        # synthesize, so health checks never build one of their own
+        self._service_status: Dict[str, str] = {
+            "stt": "unknown",
+            "llm": "unknown",
+            "tts": "unknown",
+            "redis": "unknown"
+        }
+        self._redis_client = None
         os.makedirs(UPLOADS_DIR, exist_ok=True)
         os.makedirs(GENERATED_AUDIO_DIR, exist_ok=True)
+
+    async def start(self) -> None:
+        """Start filling the warm pool. Call once the event loop is running."""
+        if self._warm is None and self.warm_pool_size > 0:
+            self._warm = asyncio.Queue(maxsize=self.warm_pool_size)
+            self._refill_warm_pool()
+
+    async def stop(self) -> None:
+        """Stop background work and shut down all orchestrators."""
+        if self._warm_task:
+            self._warm_task.cancel()
+            self._warm_task = None
+        if self._tts_worker:
+            self._tts_worker.cancel()
+            self._tts_worker = None
+        for task in list(self._tts_batches):
+            task.cancel()
+        if self._tts_queue is not None:
+            while not self._tts_queue.empty():
+                _, future = self._tts_queue.get_nowait()
+                future.cancel()
+
+        orchestrators = list(self._orchestrators.values())
+        self._orchestrators.clear()
+        self._last_used.clear()
+        if self._warm is not None:
+            while not self._warm.empty():
+                orchestrators.append(self._warm.get_nowait())
+
+        for orchestrator in orchestrators:
+            await self._shutdown_orchestrator(orchestrator)
+
+    def _refill_warm_pool(self) -> None:
+        """Schedule the warm pool to be topped up if it is not already."""
+        if self._warm is None or (self._warm_task and not self._warm_task.done()):
+            return
+        self._warm_task = asyncio.create_task(self._fill_warm_pool())
+
+    async def _fill_warm_pool(self) -> None:
+        """Pre-initialize orchestrators until the warm pool is full."""
+        while not self._warm.full():
+            orchestrator = Orchestrator()
+            try:
+                # No Redis session yet: bind_session creates the real one
+                await orchestrator.initialize(create_session=False)
+            except Exception as e:
+                logger.warning(f"Failed to pre-initialize orchestrator: {e}")
+                return
+            self._record_status(orchestrator)
+            await self._warm.put(orchestrator)
+
+    def _record_status(self, orchestrator: Orchestrator) -> None:
+        """Update service health from an initialized orchestrator's clients."""
+        status = self._service_status
+        status["llm"] = "healthy" if orchestrator._llm_client else "unhealthy"
+        status["tts"] = "healthy" if orchestrator._tts_client else "unhealthy"
+        if orchestrator._stt_client:
+            status["stt"] = "healthy"
+        if orchestrator._redis_client:
+            self._redis_client = orchestrator._redis_client
+            status["redis"] = "healthy"
+        else:
+            status["redis"] = "unhealthy"
+
+    async def _create_orchestrator(self, session_id: str) -> Orchestrator:
+        """Take an orchestrator from the warm pool, or build one."""
+        if self._warm is not None and not self._warm.empty():
+            orchestrator = self._warm.get_nowait()
+            orchestrator.bind_session(session_id)
+            logger.info(f"Assigned warm orchestrator to session: {session_id}")
+        else:
+            logger.info(f"Creating new orchestrator for session: {session_id}")
+            orchestrator = Orchestrator(session_id=session_id)
+            await orchestrator.initialize()
+            self._record_status(orchestrator)
+
+        self._refill_warm_pool()
+        return orchestrator
+
+    def _evict(self, session_id: str) -> None:
+        """Remove a session and shut its orchestrator down in the background."""
+        orchestrator = self._orchestrators.pop(session_id, None)
+        self._last_used.pop(session_id, None)
+        self._locks.pop(session_id, None)
+        if orchestrator is not None:
+            logger.info(f"Evicting session: {session_id}")
+            task = asyncio.create_task(self._shutdown_orchestrator(orchestrator))
+            self._background_tasks.add(task)
+            task.add_done_callback(self._background_tasks.discard)
+
+    def _evict_stale(self) -> None:
+        """
+        Evict expired sessions, then least recently used ones over the limit.
+
+        Orchestrators in the middle of a turn are never evicted; they are
+        reconsidered on a later call once idle.
+        """
+        orchestrators = self._orchestrators
+        cutoff = time.monotonic() - self.session_ttl
+        for session_id in [sid for sid, used in self._last_used.items() if used < cutoff]:
+            orchestrator = orchestrators.get(session_id)
+            if orchestrator is None or not orchestrator.busy:
+                self._evict(session_id)
+
+        excess = len(orchestrators) - self.max_sessions
+        if excess > 0:
+            idle = [sid for sid, orchestrator in orchestrators.items() if not orchestrator.busy]
+            for session_id in idle[:excess]:
+                self._evict(session_id)
+
+    async def _shutdown_orchestrator(self, orchestrator: Orchestrator) -> None:
+        try:
+            await orchestrator.shutdown()
+        except Exception as e:
+            logger.warning(f"Orchestrator shutdown failed: {e}")
     
     async def get_orchestrator(self, session_id: str) -> Orchestrator:
         """
@@ -44,14 +268,19 @@ class OrchestratorService:
         Returns:
             Orchestrator instance for the session
         """
-        async with self._lock:
-            if session_id not in self._orchestrators:
-                logger.info(f"Creating new orchestrator for session: {session_id}")
-                orchestrator = Orchestrator(session_id=session_id)
-                await orchestrator.initialize()
-                self._orchestrators[session_id] = orchestrator
-            
-            return self._orchestrators[session_id]
+        orchestrator = self._orchestrators.get(session_id)
+        if orchestrator is None:
+            async with self._locks[session_id]:
+                orchestrator = self._orchestrators.get(session_id)
+                if orchestrator is None:
+                    orchestrator = await self._create_orchestrator(session_id)
+                    self._orchestrators[session_id] = orchestrator
+        else:
+            self._orchestrators.move_to_end(session_id)
+
+        self._last_used[session_id] = time.monotonic()
+        self._evict_stale()
+        return orchestrator
     
     async def transcribe_audio(
         self, 
@@ -70,38 +299,31 @@ class OrchestratorService:
         """
         orchestrator = await self.get_orchestrator(session_id)
         
-        # Save audio to uploads directory
-        import uuid
-        temp_audio_path = os.path.join(UPLOADS_DIR, f"{uuid.uuid4()}.wav")
-        with open(temp_audio_path, "wb") as temp_audio:
-            temp_audio.write(audio_data)
+        # Ensure STT is initialized
+        if not orchestrator._stt_client:
+            await orchestrator.initialize_stt()
         
-        try:
-            # Ensure STT is initialized
-            if not orchestrator._stt_client:
-                await orchestrator.initialize_stt()
-            
-            # Transcribe the audio file
-            # Check if it's GroqWhisper or local Whisper
-            if hasattr(orchestrator._stt_client, "transcribe_file"):
-                text = orchestrator._stt_client.transcribe_file(temp_audio_path)
-            else:
-                # Fallback if transcribe_file is not available
-                import numpy as np
-                # This is a bit complex for a quick fix, assume transcribe_file exists or handle it
-                text = "Transcription logic needs to match STT client"
-                logger.warning("STT client does not have transcribe_file method")
-
-            logger.info(f"Transcribed audio for session {session_id}: {text}")
-            return text
-        finally:
-            # We keep it for a while and cleanup_old_files will handle it, 
-            # or we can delete it immediately if not needed for debugging.
-            # Task 11 says clean up old files, so let's let the cleanup handle it if we want to debug,
-            # but usually it's better to delete immediately if done.
-            # The task says "uploads/ and generated_audio/ directories grow forever", 
-            # implying we should use these dirs and clean them up later.
-            pass
+        stt_client = orchestrator._stt_client
+        self._service_status["stt"] = "healthy" if stt_client else "unhealthy"
+        loop = asyncio.get_running_loop()
+        
+        if hasattr(stt_client, "transcribe_bytes"):
+            # Hand the upload straight to the STT client without touching disk
+            text = await loop.run_in_executor(None, stt_client.transcribe_bytes, audio_data)
+        elif hasattr(stt_client, "transcribe_file"):
+            temp_audio_path = os.path.join(SCRATCH_DIR, f"{uuid.uuid4()}.wav")
+            with open(temp_audio_path, "wb") as temp_audio:
+                temp_audio.write(audio_data)
+            try:
+                text = await loop.run_in_executor(None, stt_client.transcribe_file, temp_audio_path)
+            finally:
+                os.remove(temp_audio_path)
+        else:
+            text = "Transcription logic needs to match STT client"
+            logger.warning("STT client does not support byte or file transcription")
+
+        logger.info(f"Transcribed audio for session {session_id}: {text}")
+        return text
     
     async def process_chat(
         self, 
@@ -124,7 +346,7 @@ class OrchestratorService:
         logger.info(f"Processed chat for session {session_id}: {result.assistant_response[:50]}...")
         return result
     
-    async def synthesize_speech(
+    async def synthesize_to_file(
         self,
         text: str,
         style: Optional[str] = None,
@@ -134,7 +356,10 @@ class OrchestratorService:
         session_id: Optional[str] = None
     ) -> str:
         """
-        Synthesize speech from text.
+        Synthesize speech from text to a file and return its path.
+
+        For callers that need a stored file; synthesize_speech streams
+        the audio instead.
         """
         # Task 19: Check cache
         cache_key = f"{text}|{style}|{pitch}|{rate}|{voice_gender}"
@@ -144,6 +369,92 @@ class OrchestratorService:
                 logger.info(f"Using cached audio for: {text[:20]}...")
                 return path
 
+        # Hand the request to the batching worker and wait for its result
+        if self._tts_queue is None:
+            self._tts_queue = asyncio.Queue()
+        if self._tts_worker is None or self._tts_worker.done():
+            self._tts_worker = asyncio.create_task(self._tts_batch_worker())
+
+        future = asyncio.get_running_loop().create_future()
+        request = (cache_key, dict(
+            text=text,
+            style=style,
+            pitch=pitch,
+            rate=rate,
+            voice_gender=voice_gender,
+            session_id=session_id
+        ))
+        await self._tts_queue.put((request, future))
+        return await future
+
+    async def _tts_batch_worker(self) -> None:
+        """
+        Coalesce pending synthesis requests and dispatch them in batches.
+
+        Waits up to TTS_MAX_WAIT_MS after the first request for more to
+        arrive, then starts up to TTS_MAX_BATCH at once in their own task,
+        so a slow synthesis never holds up the requests queued behind it.
+        Identical requests within a batch are synthesized only once.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            items = [await self._tts_queue.get()]
+            try:
+                deadline = loop.time() + TTS_MAX_WAIT_MS / 1000
+                while len(items) < TTS_MAX_BATCH:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        items.append(await asyncio.wait_for(self._tts_queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                for _, future in items:
+                    future.cancel()
+                raise
+
+            batch: Dict[str, list] = {}
+            for (cache_key, kwargs), future in items:
+                batch.setdefault(cache_key, [kwargs, []])[1].append(future)
+
+            task = asyncio.create_task(self._run_tts_batch(batch))
+            self._tts_batches.add(task)
+            task.add_done_callback(self._tts_batches.discard)
+
+    async def _run_tts_batch(self, batch: Dict[str, list]) -> None:
+        """Synthesize one batch concurrently and resolve its futures."""
+        try:
+            results = await asyncio.gather(
+                *(self._synthesize_to_path(**kwargs) for kwargs, _ in batch.values()),
+                return_exceptions=True
+            )
+            for (_, futures), result in zip(batch.values(), results):
+                for future in futures:
+                    if future.done():
+                        continue
+                    if isinstance(result, BaseException):
+                        future.set_exception(result)
+                    else:
+                        future.set_result(result)
+        finally:
+            # Cancelled mid-batch (service stopping): release the waiters
+            for _, futures in batch.values():
+                for future in futures:
+                    future.cancel()
+
+    async def _synthesize_to_path(
+        self,
+        text: str,
+        style: Optional[str] = None,
+        pitch: Optional[str] = None,
+        rate: Optional[str] = None,
+        voice_gender: Optional[str] = None,
+        session_id: Optional[str] = None
+    ) -> str:
+        """Synthesize speech to a file in GENERATED_AUDIO_DIR with fallbacks."""
+        cache_key = f"{text}|{style}|{pitch}|{rate}|{voice_gender}"
+
         # Use a default session if none provided
         if not session_id:
             session_id = "tts-default"
@@ -151,7 +462,6 @@ class OrchestratorService:
         orchestrator = await self.get_orchestrator(session_id)
         
         # Create file in generated_audio directory
-        import uuid
         filename = f"{uuid.uuid4()}.wav"
         audio_path = os.path.join(GENERATED_AUDIO_DIR, filename)
         
@@ -162,8 +472,6 @@ class OrchestratorService:
         fb = rp.fallback_manager
         
         # Try active client first, then fallback
-        from src.fallback import ServiceType
-        
         clients_to_try = []
         if fb.should_use_local(ServiceType.TTS):
             clients_to_try = [rp._local_tts_client, rp._tts_client]
@@ -181,17 +489,16 @@ class OrchestratorService:
         
         for tts_client in clients_to_try:
             try:
-                # Update TTS Client gender if supported
-                if voice_gender and hasattr(tts_client, "voice_gender"):
-                    tts_client.voice_gender = voice_gender
-                    if hasattr(tts_client, 'ssml_builder'):
-                        tts_client.ssml_builder.voice = tts_client.ssml_builder.DEFAULT_MALE_VOICE if voice_gender == "male" else tts_client.ssml_builder.DEFAULT_FEMALE_VOICE
-                
+                # Requests run concurrently on a shared client, so the
+                # voice is passed per call instead of set on the client
+                voice = _voice_for_gender(tts_client, voice_gender)
+                voice_kwargs = {"voice": voice} if voice else {}
+
                 def _speak_to_file(client):
                     if hasattr(client, "synthesize_to_file_with_params"):
-                        client.synthesize_to_file_with_params(text=text, filepath=audio_path, style=style, pitch=pitch, rate=rate)
+                        client.synthesize_to_file_with_params(text=text, filepath=audio_path, style=style, pitch=pitch, rate=rate, **voice_kwargs)
                     elif hasattr(client, "synthesize_to_bytes_with_params"):
-                        audio_bytes = client.synthesize_to_bytes_with_params(text=text, style=style, pitch=pitch, rate=rate)
+                        audio_bytes = client.synthesize_to_bytes_with_params(text=text, style=style, pitch=pitch, rate=rate, **voice_kwargs)
                         with open(audio_path, 'wb') as f:
                             f.write(audio_bytes)
                     elif hasattr(client, "synthesize_to_file"):
@@ -207,6 +514,7 @@ class OrchestratorService:
 
                 await loop.run_in_executor(None, _speak_to_file, tts_client)
                 fb.report_success(ServiceType.TTS)
+                self._service_status["tts"] = "healthy"
                 success = True
                 break
             except Exception as e:
@@ -217,8 +525,6 @@ class OrchestratorService:
         if not success:
             logger.warning(f"All primary TTS engines failed. Last error: {last_error}. Invoking unbreakable Google TTS Fallback...")
             try:
-                import urllib.parse
-                import requests
                 # Safe limit for Google Translate TTS GET requests
                 safe_text = text[:200]
                 encoded_text = urllib.parse.quote(safe_text)
@@ -228,6 +534,7 @@ class OrchestratorService:
                     with open(audio_path, 'wb') as f:
                         f.write(resp.content)
                     success = True
+                    self._service_status["tts"] = "degraded"
                     logger.info(f"Successfully generated ultimate fallback audio using Google TTS.")
                 else:
                     logger.error(f"Google TTS Fallback failed with status {resp.status_code}")
@@ -235,6 +542,7 @@ class OrchestratorService:
                 logger.error(f"Google TTS Fallback threw an exception: {fe}")
 
         if not success:
+            self._service_status["tts"] = "unhealthy"
             logger.error(f"Total TTS destruction. Last error: {last_error}")
             raise Exception(f"Failed to synthesize speech across all services: {str(last_error)}")
         
@@ -243,66 +551,111 @@ class OrchestratorService:
         
         logger.info(f"Synthesized speech to: {audio_path}")
         return audio_path
+
+    async def synthesize_speech(
+        self,
+        text: str,
+        style: Optional[str] = None,
+        pitch: Optional[str] = None,
+        rate: Optional[str] = None,
+        voice_gender: Optional[str] = None,
+        session_id: Optional[str] = None
+    ) -> AsyncIterator[bytes]:
+        """
+        Synthesize speech and yield audio bytes as they are produced.
+
+        Streams straight from the cloud TTS response without touching disk.
+        Falls back to synthesize_to_file when streaming is unavailable
+        or fails before any audio has been sent.
+        """
+        if not session_id:
+            session_id = "tts-default"
+
+        orchestrator = await self.get_orchestrator(session_id)
+        if not orchestrator.response_processor:
+            raise Exception("Orchestrator not fully initialized. Missing ResponseProcessor.")
+
+        rp = orchestrator.response_processor
+        fb = rp.fallback_manager
+        tts_client = rp._tts_client
+        if tts_client is not None and hasattr(tts_client, "synthesize_stream_with_params") and not fb.should_use_local(ServiceType.TTS):
+            # The client is shared across requests; pick the voice per call
+            chunks = tts_client.synthesize_stream_with_params(
+                text=text, style=style, pitch=pitch, rate=rate,
+                voice=_voice_for_gender(tts_client, voice_gender)
+            )
+            stream = _iterate_in_thread(chunks)
+            sent_any = False
+            try:
+                async for chunk in stream:
+                    sent_any = True
+                    yield chunk
+                fb.report_success(ServiceType.TTS)
+                self._service_status["tts"] = "healthy"
+                return
+            except Exception as e:
+                logger.warning(f"Streaming TTS failed: {e}")
+                fb.report_failure(ServiceType.TTS, str(e))
+                if sent_any:
+                    raise
+            finally:
+                await stream.aclose()
+
+        # Fall back to file-based synthesis and stream the result
+        audio_path = await self.synthesize_to_file(
+            text=text,
+            style=style,
+            pitch=pitch,
+            rate=rate,
+            voice_gender=voice_gender,
+            session_id=session_id
+        )
+        buf = bytearray(STREAM_CHUNK_SIZE)
+        view = memoryview(buf)
+        with open(audio_path, "rb") as f:
+            while True:
+                n = f.readinto(buf)
+                if not n:
+                    break
+                yield bytes(view[:n])
     
     async def get_detailed_health(self) -> dict:
         """
         Get detailed health status of all services.
         Task 13: Improve Health Check Endpoint
+
+        Reads the service-level status; only Redis is actively checked,
+        through the client's cached liveness ping.
         """
-        temp_session = "health-check"
-        try:
-            orchestrator = await self.get_orchestrator(temp_session)
-            
-            # Helper to check service
-            async def check_service(service_type):
-                try:
-                    if service_type == "redis":
-                        return "healthy" if orchestrator._redis_client and orchestrator._redis_client.ping() else "unhealthy"
-                    elif service_type == "groq":
-                        return "healthy" if orchestrator._llm_client else "unhealthy"
-                    elif service_type == "azure_tts":
-                        return "healthy" if orchestrator._tts_client else "unhealthy"
-                    return "unknown"
-                except Exception as e:
-                    logger.error(f"Health check error for {service_type}: {e}")
-                    return "unhealthy"
-
-            results = {
-                "redis": await check_service("redis"),
-                "groq": await check_service("groq"),
-                "azure_tts": await check_service("azure_tts")
-            }
-            return results
-        except Exception as e:
-            logger.error(f"Detailed health check failed: {e}")
-            return {"error": str(e)}
+        status = self._service_status
+        redis_status = status["redis"]
+        if self._redis_client is not None:
+            try:
+                connected = await self._redis_client.is_connected_async()
+                redis_status = "healthy" if connected else "unhealthy"
+            except Exception as e:
+                logger.error(f"Health check error for redis: {e}")
+                redis_status = "unhealthy"
+
+        return {
+            "redis": redis_status,
+            "groq": status["llm"],
+            "azure_tts": status["tts"]
+        }
 
     async def get_health_status(self) -> dict:
         """
         Get basic health status.
+
+        O(1) and free of I/O: returns the status recorded by real sessions.
         """
-        temp_session = "health-check"
-        try:
-            async with self._lock:
-                if temp_session in self._orchestrators:
-                    orchestrator = self._orchestrators[temp_session]
-                    fallback_status = orchestrator.get_fallback_status()
-                    return {
-                        "stt": "healthy" if orchestrator._stt_client else "not_initialized",
-                        "llm": "healthy" if orchestrator._llm_client else "not_initialized",
-                        "tts": "healthy" if orchestrator._tts_client else "not_initialized",
-                        "fallback_status": fallback_status
-                    }
-            
-            return {
-                "status": "Starting up",
-                "stt": "unknown",
-                "llm": "unknown",
-                "tts": "unknown"
-            }
-        except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            return {"status": "error", "error": str(e)}
+        health = dict(self._service_status)
+        if self._orchestrators:
+            orchestrator = next(reversed(self._orchestrators.values()))
+            health["fallback_status"] = orchestrator.get_fallback_status()
+        elif all(value == "unknown" for value in self._service_status.values()):
+            health["status"] = "Starting up"
+        return health
 
     async def cleanup_session(self, session_id: str):
         """
@@ -311,12 +664,12 @@ class OrchestratorService:
         Args:
             session_id: Session ID to clean up
         """
-        async with self._lock:
-            if session_id in self._orchestrators:
-                logger.info(f"Cleaning up session: {session_id}")
-                orchestrator = self._orchestrators[session_id]
-                await orchestrator.shutdown()
-                del self._orchestrators[session_id]
+        orchestrator = self._orchestrators.pop(session_id, None)
+        self._last_used.pop(session_id, None)
+        self._locks.pop(session_id, None)
+        if orchestrator is not None:
+            logger.info(f"Cleaning up session: {session_id}")
+            await orchestrator.shutdown()
 
 
 # Global service instance
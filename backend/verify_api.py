@@ -5,6 +5,7 @@ import sys
 import time
 import argparse
 import requests
+from requests.adapters import HTTPAdapter
 import uuid
 from pathlib import Path
 from dotenv import load_dotenv
@@ -15,6 +16,12 @@ load_dotenv(PROJECT_ROOT / ".env")
 
 BASE_URL = os.getenv("BACKEND_API_URL", "http://localhost:8000")
 
+# Shared session so every check reuses pooled keep-alive connections
+SESSION = requests.Session()
+_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 def print_status(component, status, message=""):
     color = "\033[92m" if status == "PASS" else "\033[91m"
     reset = "\033[0m"
@@ -23,7 +30,7 @@ def print_status(component, status, message=""):
 def test_health():
     """Test health check endpoint."""
     try:
-        response = requests.get(f"{BASE_URL}/api/health", timeout=5)
+        response = SESSION.get(f"{BASE_URL}/api/health", timeout=5)
         if response.status_code == 200:
             print_status("Health", "PASS", f"Status: {response.json()['status']}")
             return True
@@ -37,7 +44,7 @@ def test_health():
 def test_session():
     """Test session creation."""
     try:
-        response = requests.post(f"{BASE_URL}/api/session", timeout=5)
+        response = SESSION.post(f"{BASE_URL}/api/session", timeout=5)
         if response.status_code == 200:
             session_id = response.json().get("session_id")
             if session_id:
@@ -59,7 +66,7 @@ def test_chat(session_id):
             "session_id": session_id
         }
         start_time = time.time()
-        response = requests.post(f"{BASE_URL}/api/chat", json=payload, timeout=30)
+        response = SESSION.post(f"{BASE_URL}/api/chat", json=payload, timeout=30)
         duration = time.time() - start_time
         
         if response.status_code == 200:
@@ -86,7 +93,7 @@ def test_synthesize(text, style):
             "style": style
         }
         start_time = time.time()
-        response = requests.post(f"{BASE_URL}/api/synthesize", json=payload, timeout=60)
+        response = SESSION.post(f"{BASE_URL}/api/synthesize", json=payload, timeout=60)
         duration = time.time() - start_time
         
         if response.status_code == 200:
@@ -98,12 +105,12 @@ def test_synthesize(text, style):
             if audio_url:
                 try:
                     full_url = f"{BASE_URL}{audio_url}"
-                    audio_resp = requests.get(full_url, timeout=10)
-                    if audio_resp.status_code == 200:
-                        size = len(audio_resp.content)
-                        print_status("Audio", "PASS", f"Downloaded {size} bytes")
-                    else:
-                        print_status("Audio", "FAIL", f"Download failed: {audio_resp.status_code}")
+                    with SESSION.get(full_url, timeout=10, stream=True) as audio_resp:
+                        if audio_resp.status_code == 200:
+                            size = sum(len(chunk) for chunk in audio_resp.iter_content(chunk_size=16384))
+                            print_status("Audio", "PASS", f"Downloaded {size} bytes")
+                        else:
+                            print_status("Audio", "FAIL", f"Download failed: {audio_resp.status_code}")
                 except Exception as e:
                     print_status("Audio", "FAIL", f"Download error: {e}")
         else:
@@ -6,6 +6,7 @@ Also includes Ollama as a local fallback for offline operation.
 
 from .groq_client import GroqClient, GroqConfig, EmotionalResponse
 from .ollama_client import OllamaClient, OllamaConfig, OllamaError
+from .reply_stream import ReplySentenceStream
 
 __all__ = [
     "GroqClient",
@@ -14,4 +15,5 @@ __all__ = [
     "OllamaClient",
     "OllamaConfig",
     "OllamaError",
+    "ReplySentenceStream",
 ]
@@ -12,12 +12,17 @@ from typing import Optional, Dict, Any, Generator, Callable
 from pathlib import Path
 from dotenv import load_dotenv
 
+from .reply_stream import ReplySentenceStream
+
 logger = logging.getLogger(__name__)
 
 # Load environment variables from project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 load_dotenv(PROJECT_ROOT / ".env")
 
+# Reply returned in place of a real response when the LLM call fails
+ERROR_REPLY = "I'm sorry, I encountered an issue. Could you please repeat that?"
+
 
 @dataclass
 class GroqConfig:
@@ -187,7 +192,8 @@ class GroqClient:
         self,
         user_message: str,
         context: Optional[str] = None,
-        on_token: Optional[Callable[[str], None]] = None
+        on_token: Optional[Callable[[str], None]] = None,
+        on_sentence: Optional[Callable[[str, str], None]] = None
     ) -> EmotionalResponse:
         """
         Get an emotionally-aware response with streaming.
@@ -199,15 +205,22 @@ class GroqClient:
             user_message: The user's input text.
             context: Optional conversation context/history.
             on_token: Optional callback for each token (for real-time display).
+            on_sentence: Optional callback with (sentence, style) for each
+                complete reply sentence, called while the reply streams.
 
         Returns:
             EmotionalResponse with reply, style, and emphasis_words.
         """
         try:
             # Collect all tokens
+            sentences = ReplySentenceStream(on_sentence) if on_sentence else None
             tokens = []
             for token in self.chat_stream(user_message, context, on_chunk=on_token):
                 tokens.append(token)
+                if sentences:
+                    sentences.feed(token)
+            if sentences:
+                sentences.close()
 
             raw_response = "".join(tokens)
             return self._parse_response(raw_response)
@@ -215,7 +228,7 @@ class GroqClient:
         except Exception as e:
             logger.error(f"Error in streaming response: {e}")
             return EmotionalResponse(
-                reply="I'm sorry, I encountered an issue. Could you please repeat that?",
+                reply=ERROR_REPLY,
                 style="empathetic",
                 emphasis_words=[],
                 raw_response=str(e)
@@ -298,8 +311,8 @@ NOT generic specs like "i5, 8GB RAM".
 
 Always respond with valid JSON:
 {
-    "reply": "Your response here",
     "style": "neutral|cheerful|patient|empathetic|de_escalate",
+    "reply": "Your response here",
     "emphasis_words": ["word1", "word2"]
 }
 
@@ -333,7 +346,7 @@ Only output the JSON object, no additional text."""
             logger.error(f"Error getting emotional response: {e}")
             # Return a safe fallback response
             return EmotionalResponse(
-                reply="I'm sorry, I encountered an issue. Could you please repeat that?",
+                reply=ERROR_REPLY,
                 style="empathetic",
                 raw_response=str(e)
             )
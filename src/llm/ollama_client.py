@@ -6,107 +6,21 @@ Ollama runs models locally for offline operation.
 """
 
 import os
-import json
+import time
 import logging
-import requests
-from typing import Optional, Generator, Callable
+import threading
+import httpx
+import orjson
+from typing import Final, Optional, Generator, Callable, Iterable, Iterator
 from dataclasses import dataclass
 
-from .groq_client import EmotionalResponse
+from .groq_client import EmotionalResponse, ERROR_REPLY
+from .reply_stream import ReplySentenceStream
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
-class OllamaConfig:
-    """Configuration for Ollama client."""
-    host: str = "http://localhost:11434"
-    model: str = "llama3.2"
-    temperature: float = 0.7
-    max_tokens: int = 1024
-
-
-class OllamaError(Exception):
-    """Exception raised when Ollama request fails."""
-
-    def __init__(self, message: str, details: Optional[str] = None):
-        self.details = details
-        super().__init__(message)
-
-
-class OllamaClient:
-    """
-    Local LLM client using Ollama.
-
-    Ollama runs language models locally for offline operation.
-    Used as a fallback when Groq API is unavailable.
-    """
-
-    def __init__(self, config: Optional[OllamaConfig] = None):
-        """
-        Initialize Ollama client.
-
-        Args:
-            config: Optional OllamaConfig. If not provided, uses defaults/env vars.
-        """
-        if config is None:
-            config = OllamaConfig(
-                host=os.getenv("OLLAMA_HOST", "http://localhost:11434"),
-                model=os.getenv("OLLAMA_MODEL", "llama3.2")
-            )
-        self.config = config
-        self._available = None
-
-    def is_available(self) -> bool:
-        """
-        Check if Ollama is running and accessible.
-
-        Returns:
-            True if Ollama server is responding, False otherwise.
-        """
-        if self._available is not None:
-            return self._available
-
-        try:
-            response = requests.get(
-                f"{self.config.host}/api/tags",
-                timeout=5
-            )
-            self._available = response.status_code == 200
-        except requests.RequestException:
-            self._available = False
-
-        if not self._available:
-            logger.warning("Ollama is not available")
-
-        return self._available
-
-    def list_models(self) -> list[str]:
-        """
-        List available models in Ollama.
-
-        Returns:
-            List of model names.
-        """
-        try:
-            response = requests.get(
-                f"{self.config.host}/api/tags",
-                timeout=10
-            )
-            response.raise_for_status()
-            data = response.json()
-            return [m["name"] for m in data.get("models", [])]
-        except requests.RequestException as e:
-            logger.error(f"Failed to list Ollama models: {e}")
-            return []
-
-    def _get_system_prompt(self) -> str:
-        """
-        Get the system prompt for emotional intelligence.
-
-        Uses the same prompt as GroqClient for consistency.
-        """
-        return """You are ConversaVoice, an emotionally intelligent voice assistant that ACTS differently based on user emotions, not just acknowledges them.
+# System prompt for emotional intelligence (same prompt as GroqClient)
+_SYSTEM_PROMPT: Final[str] = """You are ConversaVoice, an emotionally intelligent voice assistant that ACTS differently based on user emotions, not just acknowledges them.
 
 ## CORE RULES
 
@@ -174,8 +88,8 @@ NOT generic specs like "i5, 8GB RAM".
 
 Always respond with valid JSON:
 {
-    "reply": "Your response here",
     "style": "neutral|cheerful|patient|empathetic|de_escalate",
+    "reply": "Your response here",
     "emphasis_words": ["word1", "word2"]
 }
 
@@ -187,6 +101,185 @@ Always respond with valid JSON:
 
 Only output the JSON object, no additional text."""
 
+# Shared system message; never mutate it, build per-call messages separately
+_SYSTEM_MESSAGE: Final[dict] = {"role": "system", "content": _SYSTEM_PROMPT}
+
+# System message serialized once per process and spliced into request bodies
+_SYSTEM_MESSAGE_JSON: Final[bytes] = orjson.dumps(_SYSTEM_MESSAGE)
+
+_JSON_HEADERS: Final[dict] = {"Content-Type": "application/json"}
+
+# Seconds to trust a cached is_available() result
+AVAILABILITY_TTL = 30.0
+
+# Keep-alive connection pools shared by all clients, keyed by host
+_http_clients: dict[str, httpx.Client] = {}
+_http_clients_lock = threading.Lock()
+
+
+def _get_http_client(host: str) -> httpx.Client:
+    """Get the shared pooled HTTP client for an Ollama host."""
+    client = _http_clients.get(host)
+    if client is None:
+        with _http_clients_lock:
+            client = _http_clients.get(host)
+            if client is None:
+                client = httpx.Client(
+                    base_url=host,
+                    timeout=httpx.Timeout(120.0, connect=5.0),
+                    limits=httpx.Limits(max_keepalive_connections=16)
+                )
+                _http_clients[host] = client
+    return client
+
+
+def _iter_ndjson(chunks: Iterable[bytes]) -> Iterator[dict]:
+    """
+    Split a raw byte stream into NDJSON objects.
+
+    Works on bytes directly so the token loop skips text decoding and
+    per-line string handling; partial lines are carried over between
+    chunks. Malformed lines are skipped.
+    """
+    buffer = bytearray()
+    for chunk in chunks:
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(b"\n", start)) != -1:
+            line = buffer[start:end]
+            start = end + 1
+            if line.strip():
+                try:
+                    yield orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue
+        del buffer[:start]
+
+    if buffer.strip():
+        try:
+            yield orjson.loads(buffer)
+        except orjson.JSONDecodeError:
+            pass
+
+
+@dataclass
+class OllamaConfig:
+    """Configuration for Ollama client."""
+    host: str = "http://localhost:11434"
+    model: str = "llama3.2"
+    temperature: float = 0.7
+    max_tokens: int = 1024
+
+
+class OllamaError(Exception):
+    """Exception raised when Ollama request fails."""
+
+    def __init__(self, message: str, details: Optional[str] = None):
+        self.details = details
+        super().__init__(message)
+
+
+class OllamaClient:
+    """
+    Local LLM client using Ollama.
+
+    Ollama runs language models locally for offline operation.
+    Used as a fallback when Groq API is unavailable.
+    """
+
+    def __init__(self, config: Optional[OllamaConfig] = None):
+        """
+        Initialize Ollama client.
+
+        Args:
+            config: Optional OllamaConfig. If not provided, uses defaults/env vars.
+        """
+        if config is None:
+            config = OllamaConfig(
+                host=os.getenv("OLLAMA_HOST", "http://localhost:11434"),
+                model=os.getenv("OLLAMA_MODEL", "llama3.2")
+            )
+        self.config = config
+        self._http = _get_http_client(config.host)
+        # (available, checked_at) from the last probe, None until probed
+        self._availability: Optional[tuple[bool, float]] = None
+
+    def is_available(self) -> bool:
+        """
+        Check if Ollama is running and accessible.
+
+        Returns:
+            True if Ollama server is responding, False otherwise.
+        """
+        now = time.monotonic()
+        cached = self._availability
+        if cached is not None and now - cached[1] < AVAILABILITY_TTL:
+            return cached[0]
+
+        try:
+            response = self._http.head("/api/tags", timeout=1.0)
+            available = response.status_code == 200
+        except httpx.HTTPError:
+            available = False
+        self._availability = (available, now)
+
+        if not available:
+            logger.warning("Ollama is not available")
+
+        return available
+
+    def invalidate(self) -> None:
+        """Drop the cached availability so the next check probes the server."""
+        self._availability = None
+
+    def list_models(self) -> list[str]:
+        """
+        List available models in Ollama.
+
+        Returns:
+            List of model names.
+        """
+        try:
+            response = self._http.get("/api/tags", timeout=10)
+            response.raise_for_status()
+            data = response.json()
+            return [m["name"] for m in data.get("models", [])]
+        except httpx.HTTPError as e:
+            logger.error(f"Failed to list Ollama models: {e}")
+            return []
+
+    def _get_system_prompt(self) -> str:
+        """
+        Get the system prompt for emotional intelligence.
+
+        Uses the same prompt as GroqClient for consistency.
+        """
+        return _SYSTEM_PROMPT
+
+    def _build_body(self, user_message: str, context: Optional[str], stream: bool) -> bytes:
+        """
+        Build the /api/chat request body.
+
+        Only the per-call tail of the message list is serialized; the
+        pre-encoded system message is spliced in front of it.
+        """
+        tail = [{"role": "user", "content": user_message}]
+        if context:
+            tail.insert(0, {"role": "user", "content": f"Previous context: {context}"})
+
+        options = orjson.dumps({
+            "model": self.config.model,
+            "stream": stream,
+            "options": {
+                "temperature": self.config.temperature,
+                "num_predict": self.config.max_tokens
+            }
+        })
+        return b"".join((
+            b'{"messages":[', _SYSTEM_MESSAGE_JSON, b",",
+            orjson.dumps(tail)[1:-1], b"],", options[1:]
+        ))
+
     def chat(self, user_message: str, context: Optional[str] = None) -> str:
         """
         Send a message to local LLM and get a response.
@@ -201,46 +294,19 @@ Only output the JSON object, no additional text."""
         if not self.is_available():
             raise OllamaError("Ollama is not available")
 
-        messages = []
-
-        # Add system prompt
-        messages.append({
-            "role": "system",
-            "content": self._get_system_prompt()
-        })
-
-        # Add context if provided
-        if context:
-            messages.append({
-                "role": "user",
-                "content": f"Previous context: {context}"
-            })
-
-        # Add current user message
-        messages.append({
-            "role": "user",
-            "content": user_message
-        })
-
         try:
-            response = requests.post(
-                f"{self.config.host}/api/chat",
-                json={
-                    "model": self.config.model,
-                    "messages": messages,
-                    "stream": False,
-                    "options": {
-                        "temperature": self.config.temperature,
-                        "num_predict": self.config.max_tokens
-                    }
-                },
+            response = self._http.post(
+                "/api/chat",
+                content=self._build_body(user_message, context, stream=False),
+                headers=_JSON_HEADERS,
                 timeout=60
             )
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             return data.get("message", {}).get("content", "")
 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
+            self.invalidate()
             raise OllamaError(f"Ollama request failed: {e}")
 
     def chat_stream(
@@ -266,61 +332,29 @@ Only output the JSON object, no additional text."""
         if not self.is_available():
             raise OllamaError("Ollama is not available")
 
-        messages = []
-
-        # Add system prompt
-        messages.append({
-            "role": "system",
-            "content": self._get_system_prompt()
-        })
-
-        # Add context if provided
-        if context:
-            messages.append({
-                "role": "user",
-                "content": f"Previous context: {context}"
-            })
-
-        # Add current user message
-        messages.append({
-            "role": "user",
-            "content": user_message
-        })
-
         try:
-            response = requests.post(
-                f"{self.config.host}/api/chat",
-                json={
-                    "model": self.config.model,
-                    "messages": messages,
-                    "stream": True,
-                    "options": {
-                        "temperature": self.config.temperature,
-                        "num_predict": self.config.max_tokens
-                    }
-                },
-                stream=True,
-                timeout=120
-            )
-            response.raise_for_status()
-
-            full_response = ""
-            for line in response.iter_lines():
-                if line:
-                    try:
-                        data = json.loads(line)
-                        if "message" in data and "content" in data["message"]:
-                            token = data["message"]["content"]
-                            full_response += token
-                            if on_chunk:
-                                on_chunk(token)
-                            yield token
-                    except json.JSONDecodeError:
-                        continue
+            with self._http.stream(
+                "POST",
+                "/api/chat",
+                content=self._build_body(user_message, context, stream=True),
+                headers=_JSON_HEADERS
+            ) as response:
+                response.raise_for_status()
+
+                full_response = ""
+                for data in _iter_ndjson(response.iter_bytes()):
+                    message = data.get("message")
+                    if message and "content" in message:
+                        token = message["content"]
+                        full_response += token
+                        if on_chunk:
+                            on_chunk(token)
+                        yield token
 
             return full_response
 
-        except requests.RequestException as e:
+        except httpx.HTTPError as e:
+            self.invalidate()
             raise OllamaError(f"Ollama streaming request failed: {e}")
 
     def _parse_response(self, raw_response: str) -> EmotionalResponse:
@@ -334,16 +368,26 @@ Only output the JSON object, no additional text."""
             Parsed EmotionalResponse object.
         """
         try:
-            json_str = raw_response.strip()
+            data = None
+
+            # Fast path: well-behaved output is a bare JSON object
+            if raw_response[:1] == "{":
+                try:
+                    data = orjson.loads(raw_response)
+                except orjson.JSONDecodeError:
+                    pass
+
+            if data is None:
+                json_str = raw_response.strip()
 
-            # Find JSON object in response
-            start_idx = json_str.find("{")
-            end_idx = json_str.rfind("}") + 1
+                # Find JSON object in response
+                start_idx = json_str.find("{")
+                end_idx = json_str.rfind("}") + 1
 
-            if start_idx != -1 and end_idx > start_idx:
-                json_str = json_str[start_idx:end_idx]
+                if start_idx != -1 and end_idx > start_idx:
+                    json_str = json_str[start_idx:end_idx]
 
-            data = json.loads(json_str)
+                data = orjson.loads(json_str)
 
             emphasis_words = data.get("emphasis_words", [])
             if not isinstance(emphasis_words, list):
@@ -356,7 +400,7 @@ Only output the JSON object, no additional text."""
                 raw_response=raw_response
             )
 
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.warning(f"Failed to parse JSON response: {e}")
             return EmotionalResponse(
                 reply=raw_response,
@@ -386,7 +430,7 @@ Only output the JSON object, no additional text."""
         except Exception as e:
             logger.error(f"Error getting emotional response: {e}")
             return EmotionalResponse(
-                reply="I'm sorry, I encountered an issue. Could you please repeat that?",
+                reply=ERROR_REPLY,
                 style="empathetic",
                 raw_response=str(e)
             )
@@ -395,7 +439,8 @@ Only output the JSON object, no additional text."""
         self,
         user_message: str,
         context: Optional[str] = None,
-        on_token: Optional[Callable[[str], None]] = None
+        on_token: Optional[Callable[[str], None]] = None,
+        on_sentence: Optional[Callable[[str, str], None]] = None
     ) -> EmotionalResponse:
         """
         Get an emotionally-aware response with streaming.
@@ -404,14 +449,21 @@ Only output the JSON object, no additional text."""
             user_message: The user's input text.
             context: Optional conversation context/history.
             on_token: Optional callback for each token.
+            on_sentence: Optional callback with (sentence, style) for each
+                complete reply sentence, called while the reply streams.
 
         Returns:
             EmotionalResponse with reply, style, and emphasis_words.
         """
         try:
+            sentences = ReplySentenceStream(on_sentence) if on_sentence else None
             tokens = []
             for token in self.chat_stream(user_message, context, on_chunk=on_token):
                 tokens.append(token)
+                if sentences:
+                    sentences.feed(token)
+            if sentences:
+                sentences.close()
 
             raw_response = "".join(tokens)
             return self._parse_response(raw_response)
@@ -419,7 +471,7 @@ Only output the JSON object, no additional text."""
         except Exception as e:
             logger.error(f"Error in streaming response: {e}")
             return EmotionalResponse(
-                reply="I'm sorry, I encountered an issue. Could you please repeat that?",
+                reply=ERROR_REPLY,
                 style="empathetic",
                 emphasis_words=[],
                 raw_response=str(e)
@@ -0,0 +1,127 @@
+"""
+Incremental reply extraction for streamed LLM output.
+
+Pulls the "style" and "reply" fields out of the JSON response while it
+is still being generated, so the reply can be spoken sentence by
+sentence instead of after the full response arrives.
+"""
+
+import re
+from typing import Callable, Optional
+
+_FIELD_START = re.compile(r'"(style|reply)"\s*:\s*"')
+
+_ESCAPES = {
+    '"': '"', "\\": "\\", "/": "/",
+    "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t",
+}
+
+
+class ReplySentenceStream:
+    """
+    Feed raw response tokens in; complete reply sentences come out.
+
+    Sentences end at '.', '!' or '?' followed by whitespace, or at a
+    newline. They are held back until the style is known, which the
+    system prompt asks the model to emit before the reply.
+    """
+
+    def __init__(self, on_sentence: Callable[[str, str], None]):
+        """
+        Args:
+            on_sentence: Called with (sentence, style) for each sentence.
+        """
+        self.on_sentence = on_sentence
+        self.style: Optional[str] = None
+        self.emitted = 0
+        self._raw = ""
+        self._pos = 0
+        self._field: Optional[str] = None
+        self._value: list[str] = []
+        self._pending: list[str] = []
+
+    def feed(self, token: str) -> None:
+        """Consume the next chunk of raw model output."""
+        self._raw += token
+        raw = self._raw
+        pos = self._pos
+
+        while True:
+            if self._field is None:
+                match = _FIELD_START.search(raw, pos)
+                if match is None:
+                    break
+                self._field = match.group(1)
+                self._value = []
+                pos = match.end()
+                continue
+
+            if pos >= len(raw):
+                break
+            ch = raw[pos]
+            if ch == '"':
+                pos += 1
+                self._end_field()
+                continue
+            if ch == "\\":
+                # Wait for the whole escape sequence to arrive
+                if pos + 1 >= len(raw):
+                    break
+                esc = raw[pos + 1]
+                if esc == "u":
+                    if pos + 6 > len(raw):
+                        break
+                    try:
+                        ch = chr(int(raw[pos + 2:pos + 6], 16))
+                    except ValueError:
+                        ch = ""
+                    pos += 6
+                else:
+                    ch = _ESCAPES.get(esc, esc)
+                    pos += 2
+            else:
+                pos += 1
+            self._append(ch)
+
+        self._pos = pos
+
+    def close(self) -> None:
+        """Flush whatever is left once the stream has ended."""
+        if self._field == "reply":
+            self._emit("".join(self._value))
+        self._field = None
+        if self.style is None:
+            self.style = "neutral"
+        self._flush_pending()
+
+    def _append(self, ch: str) -> None:
+        if self._field == "reply":
+            if ch == "\n" or (ch.isspace() and self._value and self._value[-1] in ".!?"):
+                self._emit("".join(self._value))
+                self._value = []
+                return
+        self._value.append(ch)
+
+    def _end_field(self) -> None:
+        if self._field == "style":
+            self.style = "".join(self._value) or "neutral"
+            self._flush_pending()
+        elif self._field == "reply":
+            self._emit("".join(self._value))
+        self._field = None
+        self._value = []
+
+    def _emit(self, sentence: str) -> None:
+        sentence = sentence.strip()
+        if not sentence:
+            return
+        if self.style is None:
+            self._pending.append(sentence)
+            return
+        self.emitted += 1
+        self.on_sentence(sentence, self.style)
+
+    def _flush_pending(self) -> None:
+        pending, self._pending = self._pending, []
+        for sentence in pending:
+            self._emit(sentence)
@@ -4,17 +4,29 @@ Provides connection handling and basic operations for conversation memory.
 """
 
 import os
+import re
+import json
+import time
 import logging
 from typing import Optional, Any, List, Dict, Union
 from pathlib import Path
 from dotenv import load_dotenv
 
+import redis
+import redis.asyncio as aioredis
+
 # Load env from project root
 PROJECT_ROOT = Path(__file__).parent.parent.parent
 load_dotenv(PROJECT_ROOT / ".env")
 
 logger = logging.getLogger(__name__)
 
+# Seconds a successful PING keeps is_connected() answering without I/O
+_PING_TTL = 2.0
+
+# Upper bound on pooled connections per client
+MAX_CONNECTIONS = 32
+
 
 class SimpleRedis:
     """
@@ -87,6 +99,11 @@ class SimpleRedis:
             self._data[name][key] = str(amount)
             return amount
 
+    def incr(self, name: str, amount: int = 1) -> int:
+        value = int(self._data.get(name, 0)) + amount
+        self._data[name] = str(value)
+        return value
+
     def rpush(self, name: str, *values) -> int:
         if name not in self._data:
             self._data[name] = []
@@ -110,6 +127,11 @@ class SimpleRedis:
             return self._data[name][start:]
         return self._data[name][start : end + 1]
 
+    def ltrim(self, name: str, start: int, end: int) -> bool:
+        if name in self._data and isinstance(self._data[name], list):
+            self._data[name] = self.lrange(name, start, end)
+        return True
+
     def delete(self, *names) -> int:
         count = 0
         for name in names:
@@ -130,10 +152,41 @@ class SimpleRedis:
                 count += 1
         return count
 
+    def pipeline(self, transaction: bool = True) -> "SimplePipeline":
+        return SimplePipeline(self)
+
     def close(self):
         pass
 
 
+class SimplePipeline:
+    """
+    Pipeline stand-in for SimpleRedis: queues commands and runs them
+    in order on execute().
+    """
+    def __init__(self, redis: SimpleRedis):
+        self._redis = redis
+        self._commands = []
+
+    def __getattr__(self, name: str):
+        method = getattr(self._redis, name)
+
+        def queue(*args, **kwargs):
+            self._commands.append((method, args, kwargs))
+            return self
+        return queue
+
+    def execute(self) -> list:
+        commands, self._commands = self._commands, []
+        return [method(*args, **kwargs) for method, args, kwargs in commands]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._commands = []
+
+
 class RedisClient:
     """
     Redis client wrapper for conversation memory.
@@ -142,11 +195,17 @@ class RedisClient:
     storing and retrieving conversation data.
     """
 
+    # Connection pools shared by every RedisClient in the process, keyed
+    # by connection target, so sessions don't each open their own sockets
+    _pools: Dict[tuple, Any] = {}
+    _async_pools: Dict[tuple, Any] = {}
+
     def __init__(
         self,
         host: Optional[str] = None,
         port: Optional[int] = None,
-        db: int = 0
+        db: int = 0,
+        url: Optional[str] = None
     ):
         """
         Initialize Redis client.
@@ -155,29 +214,54 @@ class RedisClient:
             host: Redis host. Defaults to REDIS_HOST env var or 'localhost'.
             port: Redis port. Defaults to REDIS_PORT env var or 6379.
             db: Redis database number. Defaults to 0.
+            url: Redis URL (e.g. redis://host:6379/0). Defaults to REDIS_URL
+                 env var; takes precedence over host/port/db when set.
         """
         self.host = host or os.getenv("REDIS_HOST", "localhost")
         self.port = port or int(os.getenv("REDIS_PORT", "6379"))
         self.db = db
+        self.url = url or os.getenv("REDIS_URL")
         self._client = None
+        self._async_client = None
         self._use_fallback = False
+        self._last_ping_ok = 0.0
+
+    @property
+    def _pool_key(self) -> tuple:
+        return (self.url,) if self.url else (self.host, self.port, self.db)
+
+    def _pool_kwargs(self) -> dict:
+        return {
+            "decode_responses": True,
+            "socket_connect_timeout": 1,  # Fast fail
+            "max_connections": MAX_CONNECTIONS,
+        }
+
+    def _get_pool(self):
+        """Get the process-wide connection pool for this target."""
+        pool = RedisClient._pools.get(self._pool_key)
+        if pool is None:
+            if self.url:
+                pool = redis.ConnectionPool.from_url(self.url, **self._pool_kwargs())
+            else:
+                pool = redis.ConnectionPool(
+                    host=self.host,
+                    port=self.port,
+                    db=self.db,
+                    **self._pool_kwargs()
+                )
+            RedisClient._pools[self._pool_key] = pool
+        return pool
 
     def _get_client(self):
         """Lazy initialization of Redis client."""
         if self._client is None:
-            import redis
             try:
                 # Try connecting to real Redis
-                client = redis.Redis(
-                    host=self.host,
-                    port=self.port,
-                    db=self.db,
-                    decode_responses=True,
-                     socket_connect_timeout=1  # Fast fail
-                )
+                client = redis.Redis(connection_pool=self._get_pool())
                 client.ping()
                 self._client = client
-                logger.info(f"Connected to Redis at {self.host}:{self.port}")
+                logger.info(f"Connected to Redis at {self.url or f'{self.host}:{self.port}'}")
             except (redis.ConnectionError, redis.TimeoutError) as e:
                 logger.warning(f"Failed to connect to Redis: {e}. Using in-memory fallback.")
                 self._use_fallback = True
@@ -185,11 +269,44 @@ class RedisClient:
                 
         return self._client
 
+    def _get_async_client(self):
+        """
+        Lazy initialization of the non-blocking client for async callers.
+
+        Returns None when running on the in-memory fallback.
+        """
+        self._get_client()
+        if self._use_fallback:
+            return None
+
+        if self._async_client is None:
+            pool = RedisClient._async_pools.get(self._pool_key)
+            if pool is None:
+                if self.url:
+                    pool = aioredis.ConnectionPool.from_url(self.url, **self._pool_kwargs())
+                else:
+                    pool = aioredis.ConnectionPool(
+                        host=self.host,
+                        port=self.port,
+                        db=self.db,
+                        **self._pool_kwargs()
+                    )
+                RedisClient._async_pools[self._pool_key] = pool
+            self._async_client = aioredis.Redis(connection_pool=pool)
+        return self._async_client
+
     @property
     def client(self):
         """Get the Redis client instance."""
         return self._get_client()
 
+    def pipeline(self):
+        """
+        Get a non-transactional pipeline for batching commands into a
+        single round trip. Use as a context manager and call execute().
+        """
+        return self.client.pipeline(transaction=False)
+
     def ping(self) -> bool:
         """Ping Redis to check connection."""
         try:
@@ -198,11 +315,42 @@ class RedisClient:
             return False
 
     def is_connected(self) -> bool:
-        """Check if Redis connection is alive."""
+        """
+        Check if Redis connection is alive.
+
+        A successful PING is trusted for _PING_TTL seconds so frequent
+        health checks don't each cost a network round-trip.
+        """
+        now = time.monotonic()
+        if now - self._last_ping_ok < _PING_TTL:
+            return True
+
         try:
             self._get_client().ping()
+            self._last_ping_ok = now
             return True
         except Exception:
+            self._last_ping_ok = 0.0
+            return False
+
+    async def is_connected_async(self) -> bool:
+        """
+        Check if Redis connection is alive without blocking the event loop.
+
+        Shares the PING cache with is_connected().
+        """
+        now = time.monotonic()
+        if now - self._last_ping_ok < _PING_TTL:
+            return True
+
+        try:
+            client = self._get_async_client()
+            if client is not None:
+                await client.ping()
+            self._last_ping_ok = now
+            return True
+        except Exception:
+            self._last_ping_ok = 0.0
             return False
 
     def close(self):
@@ -210,6 +358,7 @@ class RedisClient:
         if self._client:
             self._client.close()
             self._client = None
+            self._last_ping_ok = 0.0
             logger.info("Redis connection closed")
 
     # Session Management Methods
@@ -233,7 +382,6 @@ class RedisClient:
         Returns:
             True if session created successfully.
         """
-        import time
         key = self._session_key(session_id)
         self.client.hset(key, mapping={
             "created": "true",
@@ -258,18 +406,54 @@ class RedisClient:
         Returns:
             Number of messages in history.
         """
-        import json
-        import time
-        key = self._history_key(session_id)
+        with self.pipeline() as pipe:
+            self._queue_add_message(pipe, session_id, role, content)
+            length = pipe.execute()[0]
+        return length
+
+    def _queue_add_message(self, pipe, session_id: str, role: str, content: str) -> None:
+        """Queue the commands of add_message on a pipeline."""
         message = json.dumps({"role": role, "content": content})
-        length = self.client.rpush(key, message)
+        pipe.rpush(self._history_key(session_id), message)
 
         # Update turn count and last activity
         session_key = self._session_key(session_id)
-        self.client.hincrby(session_key, "turn_count", 1)
-        self.client.hset(session_key, "last_activity", str(int(time.time())))
+        pipe.hincrby(session_key, "turn_count", 1)
+        pipe.hset(session_key, "last_activity", str(int(time.time())))
 
-        return length
+    def add_message_with_context(
+        self,
+        session_id: str,
+        role: str,
+        content: str,
+        limit: int = 15
+    ) -> tuple[str, str, str]:
+        """
+        Add a message and read back everything the LLM context needs,
+        in one round trip.
+
+        Args:
+            session_id: Session identifier.
+            role: Message role ('user' or 'assistant').
+            content: Message content.
+            limit: Maximum number of history messages.
+
+        Returns:
+            (context string, context hint, preferences hint) as returned by
+            get_context_string, get_context_hint and get_preferences_hint.
+        """
+        with self.pipeline() as pipe:
+            self._queue_add_message(pipe, session_id, role, content)
+            pipe.lrange(self._history_key(session_id), -limit, -1)
+            pipe.hgetall(self._context_key(session_id))
+            pipe.hgetall(self._preferences_key(session_id))
+            *_, history, labels, prefs = pipe.execute()
+
+        return (
+            self._format_history([json.loads(msg) for msg in history]),
+            self._format_context_hint(self._context_labels_or_default(labels)),
+            self._format_preferences_hint(self._preferences_or_default(prefs))
+        )
 
     def get_history(self, session_id: str, limit: int = 15) -> list:
         """
@@ -282,7 +466,6 @@ class RedisClient:
         Returns:
             List of message dictionaries.
         """
-        import json
         key = self._history_key(session_id)
         messages = self.client.lrange(key, -limit, -1)
         return [json.loads(msg) for msg in messages]
@@ -298,7 +481,10 @@ class RedisClient:
         Returns:
             Formatted context string.
         """
-        history = self.get_history(session_id, limit)
+        return self._format_history(self.get_history(session_id, limit))
+
+    def _format_history(self, history: list) -> str:
+        """Format history messages as LLM context lines."""
         if not history:
             return ""
 
@@ -354,7 +540,6 @@ class RedisClient:
         Returns:
             Dict with session metadata including duration, turn_count, errors.
         """
-        import time
         session_key = self._session_key(session_id)
         data = self.client.hgetall(session_key)
 
@@ -487,8 +672,10 @@ class RedisClient:
             Dict with context labels (interaction_type, emotion, turn_count, repetition_count).
         """
         key = self._context_key(session_id)
-        labels = self.client.hgetall(key)
+        return self._context_labels_or_default(self.client.hgetall(key))
 
+    def _context_labels_or_default(self, labels: dict) -> dict:
+        """Fill in default labels for a session that has none yet."""
         if not labels:
             # Return defaults for new session
             return {
@@ -588,8 +775,10 @@ class RedisClient:
         Returns:
             Formatted hint string describing the user's context state.
         """
-        labels = self.get_context_labels(session_id)
+        return self._format_context_hint(self.get_context_labels(session_id))
 
+    def _format_context_hint(self, labels: dict) -> str:
+        """Build the context hint string from context labels."""
         hints = []
 
         # Interaction type hint
@@ -627,8 +816,10 @@ class RedisClient:
             Dict with user preferences (preferred_style, verbosity, name, etc.).
         """
         key = self._preferences_key(session_id)
-        prefs = self.client.hgetall(key)
+        return self._preferences_or_default(self.client.hgetall(key))
 
+    def _preferences_or_default(self, prefs: dict) -> dict:
+        """Fill in default preferences for a session that has none yet."""
         if not prefs:
             return {
                 "preferred_style": "neutral",
@@ -701,7 +892,6 @@ class RedisClient:
         Returns:
             Dict of detected preferences (may be empty).
         """
-        import re
         detected = {}
         message_lower = message.lower()
 
@@ -742,7 +932,10 @@ class RedisClient:
         Returns:
             Formatted hint string describing user preferences.
         """
-        prefs = self.get_user_preferences(session_id)
+        return self._format_preferences_hint(self.get_user_preferences(session_id))
+
+    def _format_preferences_hint(self, prefs: dict) -> str:
+        """Build the preferences hint string from user preferences."""
         hints = []
 
         # Name hint
@@ -9,6 +9,7 @@ CHANGE: Replaced sentence-transformers (requires PyTorch ~1.5 GB) with
 """
 
 import json
+import time
 import logging
 import numpy as np
 from typing import Optional, List, Tuple
@@ -16,6 +17,14 @@ from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+# Shared semantic cache of LLM replies, keyed by utterance embedding
+REPLY_CACHE_KEY = "reply_cache"
+# Bumped on every store so readers know when to reload the entries
+REPLY_CACHE_GEN_KEY = "reply_cache:gen"
+REPLY_CACHE_SIZE = 256
+# Seconds a cached reply may be served for
+REPLY_CACHE_TTL = 3600
+
 
 @dataclass
 class SimilarityResult:
@@ -23,6 +32,7 @@ class SimilarityResult:
     text: str
     score: float
     is_repetition: bool
+    embedding: Optional[np.ndarray] = None
 
 
 class VectorStore:
@@ -54,6 +64,11 @@ class VectorStore:
         self.model_name = model_name
         self.similarity_threshold = similarity_threshold
         self._model = None
+        # Decoded copy of the reply cache, valid for one generation
+        self._reply_gen = None
+        self._reply_entries: List[dict] = []
+        self._reply_matrix: Optional[np.ndarray] = None
+        self._reply_times: Optional[np.ndarray] = None
 
     def _get_model(self):
         """
@@ -174,7 +189,8 @@ class VectorStore:
             return SimilarityResult(
                 text="",
                 score=0.0,
-                is_repetition=False
+                is_repetition=False,
+                embedding=new_embedding
             )
 
         # Find highest similarity
@@ -201,9 +217,82 @@ class VectorStore:
         return SimilarityResult(
             text=most_similar_text,
             score=max_score,
-            is_repetition=is_repetition
+            is_repetition=is_repetition,
+            embedding=new_embedding
         )
 
+    def lookup_reply(
+        self,
+        query_vec: np.ndarray,
+        tau: float = 0.92
+    ) -> Optional[Tuple[str, str]]:
+        """
+        Find a cached reply for a semantically equivalent utterance.
+
+        Args:
+            query_vec: Embedding of the user utterance.
+            tau: Minimum cosine similarity for a hit.
+
+        Returns:
+            (reply, style) of the closest cached entry, or None on a miss.
+        """
+        gen = self.redis_client.client.get(REPLY_CACHE_GEN_KEY)
+        if gen is None:
+            return None
+        if gen != self._reply_gen:
+            self._load_reply_cache(gen)
+        if not self._reply_entries:
+            return None
+
+        norm = np.linalg.norm(query_vec)
+        if norm == 0:
+            return None
+        scores = self._reply_matrix @ (query_vec / norm)
+        scores[self._reply_times < time.time() - REPLY_CACHE_TTL] = -1.0
+
+        best = int(np.argmax(scores))
+        if scores[best] < tau:
+            return None
+
+        logger.info(f"Reply cache hit (score: {scores[best]:.2f})")
+        entry = self._reply_entries[best]
+        return entry["reply"], entry["style"]
+
+    def _load_reply_cache(self, gen) -> None:
+        """Decode the cached entries once per generation, normalizing embeddings."""
+        stored = self.redis_client.client.lrange(REPLY_CACHE_KEY, 0, -1)
+        entries = [json.loads(item) for item in stored]
+        if entries:
+            matrix = np.array([entry["embedding"] for entry in entries], dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+            self._reply_matrix = matrix / np.where(norms == 0, 1.0, norms)
+            self._reply_times = np.array([entry.get("ts", 0.0) for entry in entries])
+        self._reply_entries = entries
+        self._reply_gen = gen
+
+    def store_reply(self, query_vec: np.ndarray, reply: str, style: str) -> None:
+        """
+        Cache a reply under the embedding of the utterance it answered.
+
+        Args:
+            query_vec: Embedding of the user utterance.
+            reply: Generated reply text.
+            style: Emotional style of the reply.
+        """
+        data = {
+            "embedding": query_vec.tolist(),
+            "reply": reply,
+            "style": style,
+            "ts": time.time()
+        }
+        with self.redis_client.pipeline() as pipe:
+            pipe.rpush(REPLY_CACHE_KEY, json.dumps(data))
+            pipe.ltrim(REPLY_CACHE_KEY, -REPLY_CACHE_SIZE, -1)
+            pipe.incr(REPLY_CACHE_GEN_KEY)
+            pipe.expire(REPLY_CACHE_KEY, REPLY_CACHE_TTL)
+            pipe.expire(REPLY_CACHE_GEN_KEY, REPLY_CACHE_TTL)
+            pipe.execute()
+
     def clear_vectors(self, session_id: str) -> bool:
         """
         Clear all vectors for a session.
@@ -3,12 +3,17 @@ Refactored Orchestrator for ConversaVoice.
 Uses SessionManager and ResponseProcessor for modularity.
 """
 
+import os
+import json
 import asyncio
 import time
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Callable
 
 from .llm import GroqClient, OllamaClient
+from .llm.groq_client import ERROR_REPLY
 from .memory import RedisClient, VectorStore
 from .tts import AzureTTSClient, PiperTTSClient
 from .stt import WhisperClient, STTError
@@ -20,6 +25,27 @@ from .response_processor import ResponseProcessor
 
 logger = logging.getLogger(__name__)
 
+# Short blocking calls (Redis, embeddings) get their own bounded pool so
+# they never queue behind LLM requests or microphone reads on the default one
+_io_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="cv-io")
+
+# One local Whisper model per process, loaded and warmed on first use and
+# shared by every orchestrator (pooled sessions included)
+_shared_whisper: Optional[WhisperClient] = None
+_shared_whisper_lock = threading.Lock()
+
+
+def _get_shared_whisper() -> WhisperClient:
+    """Return the process-wide WhisperClient, loading and warming it once."""
+    global _shared_whisper
+    with _shared_whisper_lock:
+        if _shared_whisper is None:
+            client = WhisperClient()
+            client.warm_up()
+            _shared_whisper = client
+        return _shared_whisper
+
+
 class OrchestratorError(Exception):
     """Exception raised when the orchestrator encounters an error."""
     def __init__(self, message: str, component: Optional[str] = None):
@@ -32,6 +58,15 @@ class Orchestrator:
     Coordinates: STT → Session Management → Response Processing → TTS
     """
 
+    __slots__ = (
+        "session_id", "on_state_change", "on_transcription", "on_response", "on_token",
+        "_state", "_running", "_turn_slot", "_active_turns", "_tts_q", "_tts_worker",
+        "_fallback_manager", "session_manager", "response_processor", "_stt_client",
+        "_llm_client", "_local_llm_client", "_tts_client", "_local_tts_client",
+        "_redis_client", "_vector_store", "_sentiment_analyzer",
+        "_recording", "_audio_buffer", "_audio_stream", "_pyaudio_instance",
+    )
+
     def __init__(
         self,
         session_id: Optional[str] = None,
@@ -49,7 +84,16 @@ class Orchestrator:
 
         self._state = PipelineState.IDLE
         self._running = False
-        self._lock = asyncio.Lock()
+
+        # Turn sequencer: a turn holds the single slot while it builds
+        # context and calls the LLM; waiting turns queue on put() in order
+        self._turn_slot: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._active_turns = 0
+
+        # TTS stage: replies are spoken in order by a worker task while
+        # later turns build context and call the LLM
+        self._tts_q: asyncio.Queue = asyncio.Queue(maxsize=4)
+        self._tts_worker: Optional[asyncio.Task] = None
 
         # Components
         self._fallback_manager = FallbackManager(fallback_config)
@@ -84,8 +128,7 @@ class Orchestrator:
             self.on_state_change(state)
 
     def _generate_session_id(self) -> str:
-        import uuid
-        return f"session-{uuid.uuid4().hex[:8]}"
+        return f"session-{os.urandom(4).hex()}"
 
     def _on_service_mode_change(self, service_type: ServiceType, mode: ServiceMode) -> None:
         logger.info(f"Service {service_type.value} switched to {mode.value}")
@@ -93,8 +136,19 @@ class Orchestrator:
     def get_fallback_status(self) -> dict:
         return self._fallback_manager.get_summary()
 
-    async def initialize(self) -> None:
-        """Initialize all pipeline components."""
+    @property
+    def busy(self) -> bool:
+        """True while a turn is running or queued on this orchestrator."""
+        return self._active_turns > 0
+
+    async def initialize(self, create_session: bool = True) -> None:
+        """
+        Initialize all pipeline components.
+
+        Args:
+            create_session: Register session_id in Redis. Warm-pool
+                instances skip this; bind_session registers the real one.
+        """
         try:
             self._llm_client = GroqClient()
             self._fallback_manager.set_cloud_available(ServiceType.LLM, True)
@@ -113,7 +167,8 @@ class Orchestrator:
 
         try:
             self._redis_client = RedisClient()
-            self._redis_client.create_session(self.session_id)
+            if create_session:
+                self._redis_client.create_session(self.session_id)
             self._redis_client.init_prosody_profiles()
             self._vector_store = VectorStore(self._redis_client)
         except Exception as e:
@@ -122,6 +177,8 @@ class Orchestrator:
         try:
             self._tts_client = AzureTTSClient()
             self._fallback_manager.set_cloud_available(ServiceType.TTS, True)
+            # Pay the TLS handshake now instead of on the first reply
+            await self._run_blocking(self._tts_client.warm_up)
         except Exception as e:
             logger.warning(f"Cloud TTS init failed: {e}")
             self._fallback_manager.set_cloud_available(ServiceType.TTS, False)
@@ -153,108 +210,188 @@ class Orchestrator:
             self._local_tts_client
         )
 
+        # A local Whisper model is slow to load and to run its first
+        # clip; do both now rather than on the first utterance (only the
+        # first orchestrator in the process pays for it)
+        if os.getenv("STT_BACKEND", "groq").lower() != "groq":
+            try:
+                await self.initialize_stt()
+            except OrchestratorError as e:
+                logger.warning(f"STT warm-up failed: {e}")
+
+    def bind_session(self, session_id: str) -> None:
+        """
+        Rebind an initialized orchestrator to a different session.
+
+        Lets a pre-initialized orchestrator be handed to a new session
+        without recreating its LLM/TTS/Redis clients.
+        """
+        self.session_id = session_id
+        self._redis_client.create_session(session_id)
+        self.session_manager = SessionManager(
+            session_id,
+            self._redis_client,
+            self._vector_store,
+            self._sentiment_analyzer
+        )
+
     async def initialize_stt(self) -> None:
-        import os
+        if self._stt_client:
+            return
         stt_backend = os.getenv("STT_BACKEND", "groq").lower()
         try:
             if stt_backend == "groq":
                 from .stt import GroqWhisperClient
                 self._stt_client = GroqWhisperClient()
             else:
-                self._stt_client = WhisperClient()
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, self._stt_client.load_model)
+                # Model loading is long; keep it off the short-call pool
+                loop = asyncio.get_running_loop()
+                self._stt_client = await loop.run_in_executor(None, _get_shared_whisper)
         except Exception as e:
             raise OrchestratorError(f"STT init failed: {e}", component="stt")
 
     async def process_text(self, text: str, speak: bool = True) -> PipelineResult:
+        return await self._run_turn(text, speak)
+
+    async def process_text_stream(self, text: str, speak: bool = True, on_token: Optional[Callable[[str], None]] = None) -> PipelineResult:
+        return await self._run_turn(text, speak, stream=True, on_token=on_token or self.on_token)
+
+    async def _run_turn(
+        self,
+        text: str,
+        speak: bool,
+        stream: bool = False,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> PipelineResult:
+        """
+        Run one conversational turn.
+
+        Context building and the LLM call hold the turn slot; speech is
+        handed to the TTS stage worker, so the next turn's LLM call can
+        start while this reply is still being spoken. When streaming,
+        each sentence is queued for TTS as soon as it is complete.
+        """
         start_time = time.perf_counter()
-        async with self._lock:
+        spoken = []
+        self._active_turns += 1
+        try:
+            await self._turn_slot.put(None)
             try:
                 self._set_state(PipelineState.PROCESSING)
                 if self.on_transcription:
                     self.on_transcription(text)
 
                 # 1. Prepare context
-                context, is_repetition = self.session_manager.prepare_context(text)
-
-                # 2. Get LLM response
-                reply, style = await self.response_processor.get_llm_response(text, context)
-                self.session_manager.add_assistant_response(reply)
+                context, is_repetition = await self._run_blocking(self.session_manager.prepare_context, text)
+
+                # 2. Get LLM response (or a cached reply to the same utterance)
+                cached = await self._run_blocking(self.session_manager.get_cached_reply)
+                if cached:
+                    reply, style = cached
+                    if on_token:
+                        on_token(json.dumps({"style": style, "reply": reply}))
+                elif stream:
+                    on_sentence = self._sentence_sink(spoken) if speak else None
+                    reply, style = await self.response_processor.get_llm_response_stream(
+                        text, context, on_token=on_token, on_sentence=on_sentence
+                    )
+                else:
+                    reply, style = await self.response_processor.get_llm_response(text, context)
+                prosody = await self._run_blocking(self._record_reply, reply, style, not cached)
 
                 if self.on_response:
                     self.on_response(reply)
 
-                # 3. Handle TTS
-                prosody = self.session_manager.get_prosody(style)
-                if speak:
-                    try:
-                        await self.response_processor.speak(reply, style, prosody)
-                    except Exception as e:
-                        self._redis_client.record_error(self.session_id, "tts")
-                        logger.warning(f"TTS Error: {e}")
-
-                latency_ms = (time.perf_counter() - start_time) * 1000
-                self._set_state(PipelineState.IDLE)
-
-                return PipelineResult(
-                    user_input=text,
-                    assistant_response=reply,
-                    style=style,
-                    is_repetition=is_repetition,
-                    latency_ms=latency_ms,
-                    pitch=prosody.get("pitch", "0%"),
-                    rate=prosody.get("rate", "1.0")
-                )
+                # 3. Queue TTS (unless already queued sentence by sentence)
+                if speak and not spoken:
+                    spoken.append(await self._enqueue_speech(reply, style, prosody))
             except Exception as e:
                 self._set_state(PipelineState.ERROR)
                 self._redis_client.record_error(self.session_id, "pipeline")
                 raise OrchestratorError(f"Pipeline error: {e}")
+            finally:
+                self._turn_slot.get_nowait()
+
+            if spoken:
+                try:
+                    await asyncio.gather(*spoken)
+                except Exception as e:
+                    self._redis_client.record_error(self.session_id, "tts")
+                    logger.warning(f"TTS Error: {e}")
+        finally:
+            self._active_turns -= 1
+
+        latency_ms = (time.perf_counter() - start_time) * 1000
+        if self._active_turns == 0:
+            self._set_state(PipelineState.IDLE)
 
-    async def process_text_stream(self, text: str, speak: bool = True, on_token: Optional[Callable[[str], None]] = None) -> PipelineResult:
-        start_time = time.perf_counter()
-        token_callback = on_token or self.on_token
-        async with self._lock:
-            try:
-                self._set_state(PipelineState.PROCESSING)
-                if self.on_transcription:
-                    self.on_transcription(text)
-
-                # 1. Prepare context
-                context, is_repetition = self.session_manager.prepare_context(text)
-
-                # 2. Get LLM response stream
-                reply, style = await self.response_processor.get_llm_response_stream(text, context, on_token=token_callback)
-                self.session_manager.add_assistant_response(reply)
-
-                if self.on_response:
-                    self.on_response(reply)
+        return PipelineResult(
+            user_input=text,
+            assistant_response=reply,
+            style=style,
+            is_repetition=is_repetition,
+            latency_ms=latency_ms,
+            pitch=prosody.get("pitch", "0%"),
+            rate=prosody.get("rate", "1.0")
+        )
 
-                # 3. Handle TTS
-                prosody = self.session_manager.get_prosody(style)
-                if speak:
-                    try:
-                        await self.response_processor.speak(reply, style, prosody)
-                    except Exception as e:
-                        self._redis_client.record_error(self.session_id, "tts")
-                        logger.warning(f"TTS Error: {e}")
-
-                latency_ms = (time.perf_counter() - start_time) * 1000
-                self._set_state(PipelineState.IDLE)
-
-                return PipelineResult(
-                    user_input=text,
-                    assistant_response=reply,
-                    style=style,
-                    is_repetition=is_repetition,
-                    latency_ms=latency_ms,
-                    pitch=prosody.get("pitch", "0%"),
-                    rate=prosody.get("rate", "1.0")
-                )
+    async def _run_blocking(self, func: Callable, *args):
+        """Run a blocking call (Redis, embeddings) off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_io_executor, func, *args)
+
+    def _record_reply(self, reply: str, style: str, generated: bool) -> dict:
+        """Store the reply in history (and the reply cache); return its prosody."""
+        if generated and reply != ERROR_REPLY:
+            self.session_manager.cache_reply(reply, style)
+        self.session_manager.add_assistant_response(reply)
+        return self.session_manager.get_prosody(style)
+
+    def _sentence_sink(self, spoken: list) -> Callable[[str, str], None]:
+        """
+        Build an on_sentence callback that queues sentences for TTS.
+
+        The callback runs on the LLM worker thread; it blocks that thread
+        while the TTS queue is full, which throttles generation to speech.
+        """
+        loop = asyncio.get_running_loop()
+        prosody_by_style = {}
+
+        def on_sentence(sentence: str, style: str) -> None:
+            if style not in prosody_by_style:
+                prosody_by_style[style] = self.session_manager.get_prosody(style)
+            queued = asyncio.run_coroutine_threadsafe(
+                self._enqueue_speech(sentence, style, prosody_by_style[style]), loop
+            )
+            spoken.append(queued.result())
+
+        return on_sentence
+
+    async def _enqueue_speech(self, text: str, style: str, prosody: dict) -> asyncio.Future:
+        """Queue text for the TTS stage; the returned future resolves once spoken."""
+        if self._tts_worker is None or self._tts_worker.done():
+            self._tts_worker = asyncio.create_task(self._run_tts_stage())
+        done = asyncio.get_running_loop().create_future()
+        await self._tts_q.put((text, style, prosody, done))
+        return done
+
+    async def _run_tts_stage(self) -> None:
+        """TTS stage worker: speak queued replies in order."""
+        while True:
+            text, style, prosody, done = await self._tts_q.get()
+            self._set_state(PipelineState.SPEAKING)
+            try:
+                await self.response_processor.speak(text, style, prosody)
+            except asyncio.CancelledError:
+                if not done.done():
+                    done.set_exception(OrchestratorError("Orchestrator shut down", component="tts"))
+                raise
             except Exception as e:
-                self._set_state(PipelineState.ERROR)
-                self._redis_client.record_error(self.session_id, "pipeline")
-                raise OrchestratorError(f"Pipeline error: {e}")
+                if not done.done():
+                    done.set_exception(e)
+            else:
+                if not done.done():
+                    done.set_result(None)
 
     async def process_voice(self, timeout: float = 10.0, speak: bool = True) -> Optional[PipelineResult]:
         if not self._stt_client:
@@ -276,6 +413,16 @@ class Orchestrator:
 
     async def shutdown(self) -> None:
         self._running = False
+        if self._tts_worker:
+            self._tts_worker.cancel()
+            self._tts_worker = None
+        # Fail speech that was never started so waiting turns can finish
+        while not self._tts_q.empty():
+            *_, done = self._tts_q.get_nowait()
+            if not done.done():
+                done.set_exception(OrchestratorError("Orchestrator shut down", component="tts"))
+        if self._local_tts_client:
+            self._local_tts_client.close()
         if self._recording:
             try:
                 self.stop_recording_background()
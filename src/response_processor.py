@@ -30,7 +30,14 @@ class ResponseProcessor:
             return self._local_tts_client or self._tts_client
         return self._tts_client or self._local_tts_client
 
-    async def _get_llm_call(self, user_input: str, context: str, stream: bool = False, on_token: Optional[Callable[[str], None]] = None):
+    async def _get_llm_call(
+        self,
+        user_input: str,
+        context: str,
+        stream: bool = False,
+        on_token: Optional[Callable[[str], None]] = None,
+        on_sentence: Optional[Callable[[str, str], None]] = None
+    ):
         """Shared logic for LLM calls with fallback."""
         llm_client = self._get_active_llm_client()
         loop = asyncio.get_event_loop()
@@ -42,7 +49,8 @@ class ResponseProcessor:
                     lambda: llm_client.get_emotional_response_stream(
                         user_input,
                         context=context,
-                        on_token=on_token
+                        on_token=on_token,
+                        on_sentence=on_sentence
                     )
                 )
             else:
@@ -66,7 +74,8 @@ class ResponseProcessor:
                             lambda: fallback_client.get_emotional_response_stream(
                                 user_input,
                                 context=context,
-                                on_token=on_token
+                                on_token=on_token,
+                                on_sentence=on_sentence
                             )
                         )
                     else:
@@ -90,9 +99,20 @@ class ResponseProcessor:
             raise Exception("No LLM response received")
         return response.reply, response.style
 
-    async def get_llm_response_stream(self, user_input: str, context: str, on_token: Optional[Callable[[str], None]] = None) -> tuple[str, str]:
-        """Get streaming LLM response."""
-        response = await self._get_llm_call(user_input, context, stream=True, on_token=on_token)
+    async def get_llm_response_stream(
+        self,
+        user_input: str,
+        context: str,
+        on_token: Optional[Callable[[str], None]] = None,
+        on_sentence: Optional[Callable[[str, str], None]] = None
+    ) -> tuple[str, str]:
+        """
+        Get streaming LLM response.
+
+        on_sentence, if given, is called from the worker thread with each
+        complete reply sentence and its style while the response streams.
+        """
+        response = await self._get_llm_call(user_input, context, stream=True, on_token=on_token, on_sentence=on_sentence)
         if response is None:
             raise Exception("No LLM response received")
         return response.reply, response.style
@@ -1,3 +1,4 @@
+import re
 import logging
 from datetime import datetime
 from typing import Optional
@@ -6,6 +7,13 @@ from .nlp import SentimentAnalyzer
 
 logger = logging.getLogger(__name__)
 
+# Utterances whose answer depends on the injected date/time context
+_TIME_SENSITIVE_RE = re.compile(
+    r"\b(today|tonight|tomorrow|yesterday|now|date|time|day|week|weekend|"
+    r"month|year|morning|afternoon|evening|current|currently|latest)\b",
+    re.IGNORECASE
+)
+
 class SessionManager:
     """
     Manages session-specific conversation history, context, and preferences.
@@ -16,6 +24,10 @@ class SessionManager:
         self.redis_client = redis_client
         self.vector_store = vector_store
         self.sentiment_analyzer = sentiment_analyzer
+        # Embedding of the current utterance, and whether its reply may be
+        # served from or stored in the shared reply cache
+        self._last_embedding = None
+        self._reply_cacheable = False
 
     def _get_external_context(self) -> str:
         """Get current date/time context."""
@@ -44,6 +56,13 @@ class SessionManager:
         # Check for repetition
         repetition_result = self.vector_store.check_repetition(self.session_id, user_input)
         is_repetition = repetition_result.is_repetition
+        self._last_embedding = repetition_result.embedding
+        # Only opening turns use the reply cache (no earlier utterance to
+        # match); later replies depend on this session's history, and
+        # time-sensitive questions on the injected date/time
+        self._reply_cacheable = (
+            not repetition_result.text and not _TIME_SENSITIVE_RE.search(user_input)
+        )
         
         # Analyze sentiment
         detected_emotion = None
@@ -62,25 +81,38 @@ class SessionManager:
         if detected_prefs:
             self.redis_client.set_user_preferences(self.session_id, detected_prefs)
             
-        # Add user message to history
-        self.redis_client.add_message(self.session_id, "user", user_input)
+        # Add user message to history and read back context and hints
+        # in a single Redis round trip
+        context, context_hint, prefs_hint = self.redis_client.add_message_with_context(
+            self.session_id, "user", user_input
+        )
         
         # Build context string
-        context = self.redis_client.get_context_string(self.session_id)
         external_context = self._get_external_context()
         context = f"[{external_context}]\n\n{context}"
         
         # Add hints
-        context_hint = self.redis_client.get_context_hint(self.session_id)
         if context_hint:
             context = f"{context}\n\n[Context: {context_hint}]"
             
-        prefs_hint = self.redis_client.get_preferences_hint(self.session_id)
         if prefs_hint:
             context = f"{context}\n\n[User Preferences: {prefs_hint}]"
+            # Personalized replies must not be shared with other sessions
+            self._reply_cacheable = False
             
         return context, is_repetition
 
+    def get_cached_reply(self) -> Optional[tuple[str, str]]:
+        """Returns a cached (reply, style) for the current utterance, if any."""
+        if not self._reply_cacheable or self._last_embedding is None:
+            return None
+        return self.vector_store.lookup_reply(self._last_embedding)
+
+    def cache_reply(self, reply: str, style: str) -> None:
+        """Stores the reply to the current utterance in the reply cache."""
+        if self._reply_cacheable and self._last_embedding is not None:
+            self.vector_store.store_reply(self._last_embedding, reply, style)
+
     def add_assistant_response(self, response_text: str):
         """Adds assistant response to conversation history."""
         self.redis_client.add_message(self.session_id, "assistant", response_text)
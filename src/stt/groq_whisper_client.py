@@ -144,6 +144,24 @@ class GroqWhisperClient:
             logger.error(f"Groq transcription failed: {e}")
             raise STTError(f"Transcription failed: {e}")
     
+    def transcribe_bytes(self, audio_bytes: bytes, filename: str = "audio.wav") -> str:
+        """
+        Transcribe encoded audio (WAV, MP3, etc.) held in memory.
+        
+        Args:
+            audio_bytes: Encoded audio file contents
+            filename: Filename hint used by the API to detect the format
+            
+        Returns:
+            Transcribed text
+        """
+        try:
+            return self._transcribe_bytes(filename, audio_bytes)
+            
+        except Exception as e:
+            logger.error(f"Groq bytes transcription failed: {e}")
+            raise STTError(f"Transcription failed: {e}")
+    
     def transcribe_file(self, filepath: str) -> str:
         """
         Transcribe an audio file using Groq Whisper API.
@@ -164,8 +182,10 @@ class GroqWhisperClient:
             raise STTError(f"File transcription failed: {e}")
     
     def _is_speech(self, audio_chunk: np.ndarray) -> bool:
-        """Simple voice activity detection."""
-        return np.abs(audio_chunk).mean() > self.silence_threshold
+        """Simple voice activity detection on RMS energy."""
+        # Single BLAS dot product instead of abs + mean passes
+        energy = float(np.dot(audio_chunk, audio_chunk))
+        return energy > (self.silence_threshold ** 2) * audio_chunk.size
     
     def listen_once(self, timeout: float = 10.0) -> str:
         """
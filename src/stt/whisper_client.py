@@ -2,6 +2,7 @@
 
 import warnings
 import logging
+import threading
 
 # Suppress warnings
 warnings.filterwarnings("ignore", message=".*torch_dtype.*")
@@ -9,6 +10,13 @@ warnings.filterwarnings("ignore", message=".*logits_process.*")
 warnings.filterwarnings("ignore", message=".*sequentially on GPU.*")
 logging.getLogger("transformers").setLevel(logging.ERROR)
 
+# Decode budget per utterance: ~1 token per 100 ms of speech with headroom,
+# well below Whisper's 448-token limit
+MAX_NEW_TOKENS = 128
+
+# Whisper's input window; longer audio goes through the chunking pipeline
+WINDOW_SECONDS = 30
+
 
 class STTError(Exception):
     """Exception raised for STT errors."""
@@ -20,18 +28,34 @@ class WhisperClient:
     Whisper-based speech-to-text client for the orchestrator.
 
     Wraps Distil-Whisper for real-time microphone transcription
-    with voice activity detection (VAD).
+    with voice activity detection (VAD). Runs on CTranslate2 via
+    faster-whisper when installed, otherwise on the HuggingFace pipeline.
     """
 
-    def __init__(self, model_id: str = "distil-whisper/distil-large-v3"):
+    __slots__ = (
+        "model_id", "ct2_model_id", "model", "pipe", "_hf_model", "_processor", "device", "dtype",
+        "sample_rate", "chunk_duration", "silence_threshold", "min_speech_duration",
+        "_is_loaded", "_resamplers", "_listening", "_hf_lock",
+    )
+
+    def __init__(
+        self,
+        model_id: str = "distil-whisper/distil-large-v3",
+        ct2_model_id: str = "distil-large-v3"
+    ):
         """
         Initialize the Whisper client.
 
         Args:
             model_id: HuggingFace model ID for Whisper
+            ct2_model_id: faster-whisper model name or path
         """
         self.model_id = model_id
-        self.pipe = None
+        self.ct2_model_id = ct2_model_id
+        self.model = None  # faster-whisper model
+        self.pipe = None  # HuggingFace pipeline fallback
+        self._hf_model = None  # model and processor behind the pipeline
+        self._processor = None
         self.device = None
         self.dtype = None
         self.sample_rate = 16000
@@ -39,12 +63,43 @@ class WhisperClient:
         self.silence_threshold = 0.01
         self.min_speech_duration = 0.5
         self._is_loaded = False
+        # torchaudio resamplers by source rate, used when soxr is missing;
+        # their forward pass is stateless, so they are safe to share
+        self._resamplers = {}
+        # One generate() at a time on the HuggingFace model: the client may
+        # be shared across sessions and compiled graphs are not reentrant
+        self._hf_lock = threading.Lock()
 
     def load_model(self) -> None:
-        """Load the Whisper model onto GPU."""
+        """Load the Whisper model, preferring faster-whisper."""
         if self._is_loaded:
             return
 
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            self._load_pipeline()
+            return
+
+        import ctranslate2
+
+        if ctranslate2.get_cuda_device_count() > 0:
+            self.device, self.dtype = "cuda", "float16"
+        else:
+            self.device, self.dtype = "cpu", "int8"
+
+        print(f"Loading faster-whisper model on {self.device} ({self.dtype})...")
+
+        try:
+            self.model = WhisperModel(self.ct2_model_id, device=self.device, compute_type=self.dtype)
+            self._is_loaded = True
+            print("Whisper model loaded successfully!")
+
+        except Exception as e:
+            raise STTError(f"Failed to load Whisper model: {e}")
+
+    def _load_pipeline(self) -> None:
+        """Load the Whisper model as a HuggingFace pipeline."""
         import torch
         from transformers import AutoModelForSpeechSeq2Seq, AutoProcessor, pipeline
 
@@ -58,12 +113,28 @@ class WhisperClient:
                 self.model_id,
                 torch_dtype=self.dtype,
                 low_cpu_mem_usage=True,
-                use_safetensors=True
+                use_safetensors=True,
+                attn_implementation="sdpa"
             )
             model.to(self.device)
 
+            # Greedy decoding with a bounded token budget
+            model.generation_config.max_new_tokens = MAX_NEW_TOKENS
+            model.generation_config.num_beams = 1
+            model.generation_config.do_sample = False
+
+            if self.device == "cpu":
+                # int8 dynamic quantization of the Linear layers for CPU matmuls
+                model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            else:
+                # Static KV cache keeps decoder shapes fixed so the compiled graph is reused
+                model.generation_config.cache_implementation = "static"
+                model.forward = torch.compile(model.forward, mode="reduce-overhead", fullgraph=True)
+
             processor = AutoProcessor.from_pretrained(self.model_id)
 
+            self._hf_model = model
+            self._processor = processor
             self.pipe = pipeline(
                 "automatic-speech-recognition",
                 model=model,
@@ -79,10 +150,59 @@ class WhisperClient:
         except Exception as e:
             raise STTError(f"Failed to load Whisper model: {e}")
 
+    def warm_up(self) -> None:
+        """
+        Load the model and run a silent clip through it.
+
+        Triggers kernel selection (and graph capture for the compiled
+        pipeline) at startup instead of on the first user turn.
+        """
+        import numpy as np
+
+        self.load_model()
+        silence = np.zeros(self.sample_rate * self.chunk_duration, dtype=np.float32)
+        self.transcribe_audio(silence, self.sample_rate)
+
     def _is_speech(self, audio_chunk) -> bool:
-        """Simple voice activity detection."""
+        """Simple voice activity detection on RMS energy."""
+        import numpy as np
+        # Single BLAS dot product instead of abs + mean passes
+        energy = float(np.dot(audio_chunk, audio_chunk))
+        return energy > (self.silence_threshold ** 2) * audio_chunk.size
+
+    def _new_ring(self):
+        """
+        Allocate a microphone buffer for one capture loop.
+
+        Each listen call gets its own, so sessions sharing this client
+        never overwrite each other's audio.
+        """
+        import numpy as np
+
+        n_samples = int(self.sample_rate / 1024 * self.chunk_duration) * 1024
+        return np.empty(n_samples, dtype=np.float32)
+
+    def _read_chunk(self, stream, ring, keep_going=None):
+        """
+        Read one chunk_duration of microphone audio into the ring buffer.
+
+        Returns a view of the filled part of the buffer; it is overwritten
+        by the next call, so copy it if it has to be kept.
+        """
         import numpy as np
-        return np.abs(audio_chunk).mean() > self.silence_threshold
+
+        scale = np.float32(1 / 32768)
+        filled = 0
+        while filled < ring.size:
+            if keep_going is not None and not keep_going():
+                break
+            data = stream.read(1024, exception_on_overflow=False)
+            # int16 frames are scaled straight into the float32 buffer
+            samples = np.frombuffer(data, dtype=np.int16)
+            np.multiply(samples, scale, out=ring[filled:filled + samples.size])
+            filled += samples.size
+
+        return ring[:filled]
 
     def transcribe_audio(self, audio_array, sample_rate: int = 16000) -> str:
         """
@@ -97,15 +217,113 @@ class WhisperClient:
         """
         self.load_model()
 
-        # Resample if needed
         if sample_rate != self.sample_rate:
-            import torch
-            import torchaudio.functional as F
-            audio_tensor = torch.from_numpy(audio_array).float()
-            audio_array = F.resample(audio_tensor, sample_rate, self.sample_rate).numpy()
+            audio_array = self._resample(audio_array, sample_rate)
+
+        if self.model is not None:
+            return self._transcribe_ct2(audio_array.astype("float32", copy=False))
+
+        return self._transcribe_hf(audio_array)
+
+    def _transcribe_hf(self, audio_array) -> str:
+        """
+        Transcribe a 16 kHz array with the HuggingFace model.
+
+        Clips that fit one Whisper window skip the pipeline wrapper: the
+        feature extractor's log-mel output goes straight to generate.
+        The feature extractor pads or truncates to the window, so longer
+        audio goes through the pipeline with chunking instead.
+        """
+        if len(audio_array) > WINDOW_SECONDS * self.sample_rate:
+            with self._hf_lock:
+                result = self.pipe(
+                    {"array": audio_array, "sampling_rate": self.sample_rate},
+                    chunk_length_s=WINDOW_SECONDS,
+                )
+            return result["text"].strip()
+
+        import torch
+
+        features = self._processor.feature_extractor(
+            audio_array, sampling_rate=self.sample_rate, return_tensors="pt"
+        ).input_features.to(self.device, dtype=self.dtype)
+        with self._hf_lock, torch.inference_mode():
+            token_ids = self._hf_model.generate(
+                features, language="en", task="transcribe", return_timestamps=False
+            )
+        return self._processor.batch_decode(token_ids, skip_special_tokens=True)[0].strip()
+
+    def _resample(self, audio_array, sample_rate: int):
+        """Resample to the model rate with soxr, else a cached torchaudio filter."""
+        try:
+            import soxr
+        except ImportError:
+            pass
+        else:
+            return soxr.resample(audio_array, sample_rate, self.sample_rate, quality="HQ")
+
+        import torch
+        import torchaudio
 
-        result = self.pipe({"array": audio_array, "sampling_rate": self.sample_rate})
-        return result["text"].strip()
+        resampler = self._resamplers.get(sample_rate)
+        if resampler is None:
+            resampler = self._resamplers.setdefault(
+                sample_rate, torchaudio.transforms.Resample(sample_rate, self.sample_rate)
+            )
+        with torch.inference_mode():
+            return resampler(torch.from_numpy(audio_array).float()).numpy()
+
+    def _transcribe_ct2(self, audio) -> str:
+        """Transcribe a 16 kHz array or an encoded file object with faster-whisper."""
+        segments, _ = self.model.transcribe(
+            audio,
+            language="en",
+            beam_size=1,
+            vad_filter=False,
+            without_timestamps=True,
+            condition_on_previous_text=False,
+            max_new_tokens=MAX_NEW_TOKENS
+        )
+        return "".join(segment.text for segment in segments).strip()
+
+    def transcribe_bytes(self, audio_bytes: bytes) -> str:
+        """
+        Transcribe encoded audio held in memory.
+
+        16-bit PCM WAV is decoded directly; other formats are handed to
+        the model, which decodes them itself.
+
+        Args:
+            audio_bytes: Encoded audio file contents
+
+        Returns:
+            Transcribed text
+        """
+        import io
+        import wave
+        import numpy as np
+
+        try:
+            with wave.open(io.BytesIO(audio_bytes), "rb") as wf:
+                sample_rate = wf.getframerate()
+                n_channels = wf.getnchannels()
+                sample_width = wf.getsampwidth()
+                frames = wf.readframes(wf.getnframes())
+        except (wave.Error, EOFError):
+            self.load_model()
+            if self.model is not None:
+                return self._transcribe_ct2(io.BytesIO(audio_bytes))
+            result = self.pipe(audio_bytes)
+            return result["text"].strip()
+
+        if sample_width != 2:
+            raise STTError(f"Unsupported WAV sample width: {sample_width * 8} bits")
+
+        audio_array = np.frombuffer(frames, dtype=np.int16).astype(np.float32) / 32768.0
+        if n_channels > 1:
+            audio_array = audio_array.reshape(-1, n_channels).mean(axis=1)
+
+        return self.transcribe_audio(audio_array, sample_rate)
 
     def start_listening(self, callback=None) -> None:
         """
@@ -129,7 +347,7 @@ class WhisperClient:
             raise STTError("No microphone found!")
 
         stream = p.open(
-            format=pyaudio.paFloat32,
+            format=pyaudio.paInt16,
             channels=1,
             rate=self.sample_rate,
             input=True,
@@ -139,25 +357,19 @@ class WhisperClient:
         print("\n[Listening... Press Ctrl+C to stop]\n")
 
         audio_buffer = []
+        ring = self._new_ring()
 
         try:
             while self._listening:
                 # Read audio chunk
-                frames = []
-                for _ in range(0, int(self.sample_rate / 1024 * self.chunk_duration)):
-                    if not self._listening:
-                        break
-                    data = stream.read(1024, exception_on_overflow=False)
-                    frames.append(np.frombuffer(data, dtype=np.float32))
-
-                if not frames:
-                    break
+                audio_chunk = self._read_chunk(stream, ring, lambda: self._listening)
 
-                audio_chunk = np.concatenate(frames)
+                if not audio_chunk.size:
+                    break
 
                 # Check for speech
                 if self._is_speech(audio_chunk):
-                    audio_buffer.append(audio_chunk)
+                    audio_buffer.append(audio_chunk.copy())
                 elif audio_buffer:
                     # Process accumulated speech
                     full_audio = np.concatenate(audio_buffer)
@@ -208,7 +420,7 @@ class WhisperClient:
             raise STTError("No microphone found!")
 
         stream = p.open(
-            format=pyaudio.paFloat32,
+            format=pyaudio.paInt16,
             channels=1,
             rate=self.sample_rate,
             input=True,
@@ -218,6 +430,7 @@ class WhisperClient:
         print("[Listening for speech...]")
 
         audio_buffer = []
+        ring = self._new_ring()
         start_time = time.time()
         speech_detected = False
 
@@ -228,17 +441,12 @@ class WhisperClient:
                     break
 
                 # Read audio chunk
-                frames = []
-                for _ in range(0, int(self.sample_rate / 1024 * self.chunk_duration)):
-                    data = stream.read(1024, exception_on_overflow=False)
-                    frames.append(np.frombuffer(data, dtype=np.float32))
-
-                audio_chunk = np.concatenate(frames)
+                audio_chunk = self._read_chunk(stream, ring)
 
                 # Check for speech
                 if self._is_speech(audio_chunk):
                     speech_detected = True
-                    audio_buffer.append(audio_chunk)
+                    audio_buffer.append(audio_chunk.copy())
                 elif speech_detected and audio_buffer:
                     # Speech ended, process it
                     full_audio = np.concatenate(audio_buffer)
@@ -1,12 +1,32 @@
 import os
+import re
 import requests
+from requests.adapters import HTTPAdapter
+import urllib3
 import tempfile
 import logging
+from pathlib import Path
 from typing import Optional, Callable, Generator
 from src.tts.ssml_builder import ProsodyProfile, SSMLBuilder
 
 logger = logging.getLogger(__name__)
 
+# Sentence boundaries for chunked synthesis
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Transient WAV files go to tmpfs when available (None = default tempdir)
+TEMP_AUDIO_DIR: Optional[str] = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Read size for streamed synthesis responses
+STREAM_CHUNK_SIZE = 16 * 1024
+
+# Concurrent keep-alive connections kept open to the Azure endpoint
+CONNECTION_POOL_SIZE = 3
+
+# Headerless PCM used for streamed local playback
+RAW_STREAM_FORMAT = "raw-24khz-16bit-mono-pcm"
+RAW_STREAM_SAMPLE_RATE = 24000
+
 class TTSError(Exception):
     """Exception raised when TTS synthesis fails."""
     def __init__(self, message: str, reason: Optional[str] = None, details: Optional[str] = None):
@@ -20,6 +40,8 @@ class AzureTTSClient:
     Bypasses the C++ SDK to avoid Linux/Render audio driver crashes (ALSA) and local deadlocks.
     """
 
+    __slots__ = ("subscription_key", "region", "voice_gender", "ssml_builder", "_available", "_session")
+
     def __init__(
         self,
         subscription_key: Optional[str] = None,
@@ -35,10 +57,34 @@ class AzureTTSClient:
         )
         self._available = None
 
+        # One long-lived HTTP session per client so every synthesis reuses
+        # a warm TLS connection instead of reconnecting to Azure
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=CONNECTION_POOL_SIZE)
+        self._session.mount("https://", adapter)
+        self._session.headers.update(self._headers())
+
     @property
     def _base_url(self):
         return f"https://{self.region}.tts.speech.microsoft.com/cognitiveservices/v1"
 
+    def warm_up(self) -> bool:
+        """
+        Open the pooled TLS connection to the TTS endpoint ahead of the
+        first synthesis. Any HTTP response counts; only network errors fail.
+        """
+        if not self.is_available():
+            return False
+        try:
+            self._session.head(
+                f"https://{self.region}.tts.speech.microsoft.com/cognitiveservices/voices/list",
+                timeout=5
+            )
+            return True
+        except requests.exceptions.RequestException as e:
+            logger.warning(f"Azure TTS warm-up failed: {e}")
+            return False
+
     def is_available(self) -> bool:
         if self._available is not None:
             return self._available
@@ -51,19 +97,20 @@ class AzureTTSClient:
         self._available = True
         return True
 
-    def _synthesize_rest(self, ssml: str) -> bytes:
-        if not self.is_available():
-            raise TTSError("Azure TTS not configured correctly")
-            
-        headers = {
+    def _headers(self) -> dict:
+        return {
             'Ocp-Apim-Subscription-Key': self.subscription_key,
             'Content-Type': 'application/ssml+xml',
             'X-Microsoft-OutputFormat': 'riff-16khz-16bit-mono-pcm',
             'User-Agent': 'ConversaVoice'
         }
+
+    def _synthesize_rest(self, ssml: str) -> bytes:
+        if not self.is_available():
+            raise TTSError("Azure TTS not configured correctly")
         
         try:
-            response = requests.post(self._base_url, headers=headers, data=ssml.encode('utf-8'), timeout=15)
+            response = self._session.post(self._base_url, data=ssml.encode('utf-8'), timeout=15)
             if response.status_code == 200:
                 return response.content
             else:
@@ -71,6 +118,50 @@ class AzureTTSClient:
         except requests.exceptions.RequestException as e:
             raise TTSError("Azure TTS network request failed", "NetworkError", str(e))
 
+    def synthesize_stream(
+        self,
+        ssml: str,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+        output_format: Optional[str] = None
+    ) -> Generator[bytes, None, None]:
+        """
+        Stream synthesized audio as Azure produces it.
+
+        Yields chunks of the WAV response body (or of output_format, if
+        given) instead of waiting for the full utterance, so callers can
+        forward the first bytes immediately.
+        """
+        if not self.is_available():
+            raise TTSError("Azure TTS not configured correctly")
+
+        headers = {'X-Microsoft-OutputFormat': output_format} if output_format else None
+        try:
+            response = self._session.post(
+                self._base_url, data=ssml.encode('utf-8'), headers=headers, timeout=15, stream=True
+            )
+        except requests.exceptions.RequestException as e:
+            raise TTSError("Azure TTS network request failed", "NetworkError", str(e))
+
+        with response:
+            if response.status_code != 200:
+                raise TTSError("Azure TTS REST API failed", str(response.status_code), response.text)
+            # Read into one reusable buffer instead of allocating per chunk
+            buf = bytearray(chunk_size)
+            view = memoryview(buf)
+            response.raw.decode_content = True
+            try:
+                while True:
+                    n = response.raw.readinto(buf)
+                    if not n:
+                        break
+                    yield bytes(view[:n])
+            except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
+                raise TTSError("Azure TTS stream interrupted", "NetworkError", str(e))
+
+    def synthesize_stream_with_params(self, text: str, style: Optional[str] = None, pitch: Optional[str] = None, rate: Optional[str] = None, voice: Optional[str] = None) -> Generator[bytes, None, None]:
+        ssml = self.ssml_builder.build_ssml_fast(text=text, style=style, pitch=pitch, rate=rate, voice=voice)
+        return self.synthesize_stream(ssml)
+
     def synthesize_to_file(self, text: str, filepath: str, profile: ProsodyProfile = ProsodyProfile.NEUTRAL, **kwargs) -> str:
         ssml = self.ssml_builder.build(text, profile=profile, **kwargs)
         audio_data = self._synthesize_rest(ssml)
@@ -78,8 +169,8 @@ class AzureTTSClient:
             f.write(audio_data)
         return filepath
 
-    def synthesize_to_file_with_params(self, text: str, filepath: str, style: Optional[str] = None, pitch: Optional[str] = None, rate: Optional[str] = None) -> str:
-        ssml = self.ssml_builder.build_from_llm_response(text=text, style=style, pitch=pitch, rate=rate)
+    def synthesize_to_file_with_params(self, text: str, filepath: str, style: Optional[str] = None, pitch: Optional[str] = None, rate: Optional[str] = None, voice: Optional[str] = None) -> str:
+        ssml = self.ssml_builder.build_ssml_fast(text=text, style=style, pitch=pitch, rate=rate, voice=voice)
         audio_data = self._synthesize_rest(ssml)
         with open(filepath, "wb") as f:
             f.write(audio_data)
@@ -89,24 +180,43 @@ class AzureTTSClient:
         ssml = self.ssml_builder.build(text, profile=profile, **kwargs)
         return self._synthesize_rest(ssml)
         
-    def synthesize_to_bytes_with_params(self, text: str, style: Optional[str] = None, pitch: Optional[str] = None, rate: Optional[str] = None) -> bytes:
-        ssml = self.ssml_builder.build_from_llm_response(text=text, style=style, pitch=pitch, rate=rate)
+    def synthesize_to_bytes_with_params(self, text: str, style: Optional[str] = None, pitch: Optional[str] = None, rate: Optional[str] = None, voice: Optional[str] = None) -> bytes:
+        ssml = self.ssml_builder.build_ssml_fast(text=text, style=style, pitch=pitch, rate=rate, voice=voice)
         return self._synthesize_rest(ssml)
 
     def speak(self, text: str, profile: ProsodyProfile = ProsodyProfile.NEUTRAL, **kwargs) -> None:
         if not self.is_available():
             raise TTSError("Azure TTS is not available")
-        audio_data = self._synthesize_rest(self.ssml_builder.build(text, profile=profile, **kwargs))
-        self._play_audio_bytes(audio_data)
+        self._speak_ssml(self.ssml_builder.build(text, profile=profile, **kwargs))
 
     def speak_with_llm_params(self, text: str, style: Optional[str] = None, pitch: Optional[str] = None, rate: Optional[str] = None) -> None:
         if not self.is_available():
             raise TTSError("Azure TTS is not available")
-        audio_data = self._synthesize_rest(self.ssml_builder.build_from_llm_response(text=text, style=style, pitch=pitch, rate=rate))
-        self._play_audio_bytes(audio_data)
+        self._speak_ssml(self.ssml_builder.build_ssml_fast(text=text, style=style, pitch=pitch, rate=rate))
+
+    def _speak_ssml(self, ssml: str) -> None:
+        """Play SSML, streaming to the sound card when sounddevice is available."""
+        try:
+            import sounddevice as sd
+            output = sd.RawOutputStream(samplerate=RAW_STREAM_SAMPLE_RATE, channels=1, dtype="int16")
+        except (ImportError, OSError) as e:
+            logger.debug(f"Streamed playback unavailable ({e}), using system player")
+            self._play_audio_bytes(self._synthesize_rest(ssml))
+            return
+
+        # Playback starts with the first chunk rather than the full utterance
+        with output:
+            leftover = b""
+            for chunk in self.synthesize_stream(ssml, output_format=RAW_STREAM_FORMAT):
+                chunk = leftover + chunk
+                # Only whole 16-bit frames can be written
+                usable = len(chunk) & ~1
+                leftover = chunk[usable:]
+                if usable:
+                    output.write(chunk[:usable])
 
     def _play_audio_bytes(self, audio_data: bytes) -> None:
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False, dir=TEMP_AUDIO_DIR) as f:
             f.write(audio_data)
             temp_path = f.name
 
@@ -122,8 +232,8 @@ class AzureTTSClient:
                     except (subprocess.SubprocessError, FileNotFoundError):
                         continue
         finally:
-            if os.name != "nt" and os.path.exists(temp_path):
-                os.unlink(temp_path)
+            if os.name != "nt":
+                Path(temp_path).unlink(missing_ok=True)
 
     def speak_chunked(
         self,
@@ -134,8 +244,7 @@ class AzureTTSClient:
         on_sentence_start: Optional[Callable[[str, int], None]] = None,
         on_sentence_complete: Optional[Callable[[int], None]] = None
     ) -> None:
-        import re
-        sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+        sentences = _SENT_SPLIT_RE.split(text.strip())
         sentences = [s.strip() for s in sentences if s.strip()]
         
         for i, sentence in enumerate(sentences):
@@ -159,8 +268,7 @@ class AzureTTSClient:
         pitch: Optional[str] = None,
         rate: Optional[str] = None
     ) -> Generator[bytes, None, None]:
-        import re
-        sentences = re.split(r'(?<=[.!?])\s+', text.strip())
+        sentences = _SENT_SPLIT_RE.split(text.strip())
         sentences = [s.strip() for s in sentences if s.strip()]
         
         for sentence in sentences:
@@ -5,16 +5,89 @@ Provides local text-to-speech synthesis as a fallback when Azure TTS is unavaila
 Piper is a fast, local neural TTS engine.
 """
 
+import io
 import os
+import asyncio
+import re
+import sys
+import json
+import hashlib
+import shutil
 import subprocess
 import tempfile
+import threading
 import wave
 import logging
-from typing import Optional, Callable, Generator
+from collections import OrderedDict, deque
+from concurrent.futures import Future, InvalidStateError, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from itertools import islice
+from typing import Optional, Callable, Generator, Iterable
 from pathlib import Path
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Flag to track if sounddevice (and its PortAudio library) is available
+SOUNDDEVICE_AVAILABLE = False
+try:
+    import sounddevice as sd
+    SOUNDDEVICE_AVAILABLE = True
+except (ImportError, OSError):
+    sd = None
+
+# Flag to track if PyICU is available for locale-aware sentence splitting
+ICU_AVAILABLE = False
+try:
+    import icu
+    ICU_AVAILABLE = True
+except ImportError:
+    icu = None
+
+# Flag to track if the piper-tts package is available for in-process synthesis
+PIPER_PYTHON_AVAILABLE = False
+try:
+    from piper import PiperVoice
+    PIPER_PYTHON_AVAILABLE = True
+except ImportError:
+    PiperVoice = None
+
+# In-process voices shared by every client, keyed by (model path, use CUDA);
+# None marks a model that failed to load
+_voices: dict[tuple[str, bool], Optional["PiperVoice"]] = {}
+_voices_lock = threading.Lock()
+
+# Sentence boundaries for chunked synthesis when PyICU is not installed
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
+# Transient WAV files go to tmpfs when available (None = default tempdir)
+TEMP_AUDIO_DIR: Optional[str] = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+# Pipe capacity for piper output, so a whole WAV drains in a few reads
+PIPE_SIZE = 1024 * 1024
+
+# Growth step of the buffer piper's stdout is read into
+READ_CHUNK = 64 * 1024
+_READ_CHUNK_ZEROS = bytes(READ_CHUNK)
+
+# Long-lived piper processes kept per client, one per speech rate
+MAX_PIPER_WORKERS = 4
+
+# Sentences synthesized ahead of playback in the chunked paths
+DEFAULT_TTS_CONCURRENCY = 3
+
+CACHE_ROOT = Path.home() / ".cache" / "conversavoice"
+
+# Synthesized audio cache: recent WAVs in memory, optionally also on disk
+AUDIO_CACHE_SIZE = 256
+AUDIO_CACHE_DIR = CACHE_ROOT / "piper"
+
+# Disk tier size cap; least recently used files are pruned past it
+AUDIO_DISK_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# is_available() results shared across processes, keyed by piper binary
+AVAILABILITY_FILE = CACHE_ROOT / "piper_ok"
+
 
 class PiperTTSError(Exception):
     """Exception raised when Piper TTS synthesis fails."""
@@ -24,6 +97,167 @@ class PiperTTSError(Exception):
         super().__init__(message)
 
 
+def _pipe_size_kwargs() -> dict:
+    """Popen pipe-size argument where the runtime supports it (3.10+)."""
+    if sys.version_info >= (3, 10):
+        return {"pipesize": PIPE_SIZE}
+    return {}
+
+
+def _grow_pipe(pipe) -> None:
+    """Enlarge a pipe with F_SETPIPE_SZ on Linux runtimes without Popen(pipesize=)."""
+    if sys.version_info >= (3, 10) or not sys.platform.startswith("linux"):
+        return
+    try:
+        import fcntl
+        fcntl.fcntl(pipe.fileno(), 1031, PIPE_SIZE)  # F_SETPIPE_SZ
+    except OSError:
+        pass
+
+
+def _read_all_into(pipe) -> bytearray:
+    """
+    Read a pipe to EOF into one bytearray grown in READ_CHUNK steps.
+
+    Avoids the list of partial chunks read()/communicate() build up
+    while the output arrives.
+    """
+    buf = bytearray(READ_CHUNK)
+    n = 0
+    while True:
+        if n == len(buf):
+            buf.extend(_READ_CHUNK_ZEROS)
+        with memoryview(buf)[n:] as view:
+            got = pipe.readinto(view)
+        if not got:
+            break
+        n += got
+    del buf[n:]
+    return buf
+
+
+def _wav_pcm(audio_bytes: bytes) -> tuple[memoryview, int, int]:
+    """
+    Locate the samples of a PCM WAV without copying them.
+
+    Only the header is parsed; returns (sample bytes, sample rate, channels).
+    """
+    with wave.open(io.BytesIO(audio_bytes), "rb") as wf:
+        sample_rate = wf.getframerate()
+        n_channels = wf.getnchannels()
+        n_bytes = wf.getnframes() * n_channels * wf.getsampwidth()
+    return memoryview(audio_bytes)[len(audio_bytes) - n_bytes:], sample_rate, n_channels
+
+
+class _PiperWorker:
+    """
+    A long-lived piper process that keeps its voice model loaded.
+
+    Requests are JSON lines on stdin naming an output WAV file; piper
+    prints the path on stdout once the file is written. Requests are
+    written as soon as they arrive, so concurrent callers (e.g. the
+    sentences of one reply) queue up inside piper and are synthesized
+    back to back; a reader thread completes them in FIFO order.
+    """
+
+    def __init__(self, cmd: list[str]):
+        self._proc = subprocess.Popen(
+            cmd + ["--json-input", "--output_dir", TEMP_AUDIO_DIR or tempfile.gettempdir()],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            bufsize=0
+        )
+        self._write_lock = threading.Lock()
+        self._pending: "deque[Future]" = deque()
+        self._reader = threading.Thread(target=self._read_results, name="piper-reader", daemon=True)
+        self._reader.start()
+
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def synthesize(self, text: str, timeout: float = 30) -> bytes:
+        """Synthesize one utterance; returns WAV bytes."""
+        fd, path = tempfile.mkstemp(suffix=".wav", dir=TEMP_AUDIO_DIR)
+        os.close(fd)
+        done: Future = Future()
+        try:
+            request = memoryview((json.dumps({"text": text, "output_file": path}) + "\n").encode("utf-8"))
+            with self._write_lock:
+                self._pending.append(done)
+                stdin_fd = self._proc.stdin.fileno()
+                while request:
+                    request = request[os.write(stdin_fd, request):]
+            try:
+                done.result(timeout=timeout)
+            except FutureTimeoutError:
+                # A hung process would stall every request queued behind
+                # it; kill it (failing those requests) before the file
+                # below is removed, so piper cannot write it afterwards
+                self.kill()
+                raise PiperTTSError("Piper synthesis timed out")
+            with open(path, "rb") as f:
+                return f.read()
+        finally:
+            Path(path).unlink(missing_ok=True)
+
+    def _read_results(self) -> None:
+        """Complete pending requests as piper reports each finished file."""
+        stdout_fd = self._proc.stdout.fileno()
+        while True:
+            try:
+                data = os.read(stdout_fd, 65536)
+            except OSError:
+                break
+            if not data:
+                break
+            # One completed request per line piper prints
+            for _ in range(data.count(b"\n")):
+                if self._pending:
+                    self._pending.popleft().set_result(None)
+        self._fail_pending()
+
+    def _fail_pending(self) -> None:
+        while True:
+            try:
+                future = self._pending.popleft()
+            except IndexError:
+                return
+            try:
+                future.set_exception(PiperTTSError("Piper process exited"))
+            except InvalidStateError:
+                pass
+
+    def kill(self) -> None:
+        """Stop the process now and fail every request still queued on it."""
+        self._proc.kill()
+        self._reap()
+
+    def close(self) -> None:
+        """Let the process finish its queue and exit, killing it if it hangs."""
+        try:
+            self._proc.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._proc.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            self._proc.kill()
+        self._reap()
+
+    def _reap(self) -> None:
+        """Wait for the exited process, join the reader and release the pipes."""
+        self._proc.wait()
+        if self._reader is not threading.current_thread():
+            self._reader.join(timeout=2)
+        for pipe in (self._proc.stdin, self._proc.stdout):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+        self._fail_pending()
+
+
 class PiperTTSClient:
     """
     Local TTS client using Piper.
@@ -36,7 +270,9 @@ class PiperTTSClient:
         self,
         piper_path: Optional[str] = None,
         model_path: Optional[str] = None,
-        voice: str = "en_US-lessac-medium"
+        voice: str = "en_US-lessac-medium",
+        device: Optional[str] = None,
+        disk_cache: Optional[bool] = None
     ):
         """
         Initialize Piper TTS client.
@@ -45,11 +281,46 @@ class PiperTTSClient:
             piper_path: Path to piper executable (defaults to PIPER_PATH env var or 'piper')
             model_path: Path to voice model (defaults to PIPER_MODEL_PATH env var)
             voice: Voice model name (used if model_path not specified)
+            device: "cpu", "cuda" or "auto" for in-process synthesis
+                (defaults to PIPER_DEVICE env var or "auto")
+            disk_cache: Also keep synthesized audio on disk across runs
+                (defaults to PIPER_DISK_CACHE env var, off unless "1")
         """
         self.piper_path = piper_path or os.getenv("PIPER_PATH", "piper")
         self.model_path = model_path or os.getenv("PIPER_MODEL_PATH")
         self.voice = voice
+        self.device = (device or os.getenv("PIPER_DEVICE", "auto")).lower()
         self._available = None
+        # In-process voice (piper-tts), loaded on first use
+        self._voice = None
+        self._voice_loaded = False
+        self._voice_lock = threading.Lock()
+        # ICU sentence splitter for the voice's locale, built on first use
+        self._splitter = None
+        self._splitter_lock = threading.Lock()
+        # piper executable and model arguments shared by every invocation
+        self._base_cmd = [self.piper_path, "--model", self.model_path or self.voice]
+        self._workers: dict[Optional[float], _PiperWorker] = {}
+        self._workers_lock = threading.Lock()
+        self._audio_cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        if disk_cache is None:
+            disk_cache = os.getenv("PIPER_DISK_CACHE", "0").lower() in ("1", "true", "yes")
+        self.disk_cache = disk_cache
+        # Bytes in the disk tier, measured on the first write
+        self._disk_bytes: Optional[int] = None
+
+        # Sample format for the output device ("int16" unless it refuses it),
+        # and the reused float32 buffer when conversion is needed
+        self._play_dtype: Optional[str] = None
+        self._play_buffer: Optional[np.ndarray] = None
+
+        # Fallback player when sounddevice is missing, found once
+        self._sys_player = None
+        if os.name == "posix":
+            self._sys_player = next(
+                (player for player in ("aplay", "paplay", "afplay") if shutil.which(player)), None
+            )
 
     def is_available(self) -> bool:
         """
@@ -61,26 +332,64 @@ class PiperTTSClient:
         if self._available is not None:
             return self._available
 
-        try:
-            result = subprocess.run(
-                [self.piper_path, "--help"],
-                capture_output=True,
-                timeout=5
-            )
-            self._available = result.returncode == 0
-        except (subprocess.SubprocessError, FileNotFoundError, OSError):
-            self._available = False
+        # Checked without loading the voice; that happens on first synthesis
+        if self._has_voice_model():
+            self._available = True
+            return True
+
+        key = self._availability_key()
+        cached = self._read_availability(key)
+        if cached is not None:
+            self._available = cached
+        else:
+            try:
+                result = subprocess.run(
+                    [self.piper_path, "--help"],
+                    capture_output=True,
+                    timeout=5
+                )
+                self._available = result.returncode == 0
+            except (subprocess.SubprocessError, FileNotFoundError, OSError):
+                self._available = False
+            if key:
+                self._write_availability(key, self._available)
 
         if not self._available:
             logger.warning("Piper TTS not available on this system")
 
         return self._available
 
-    def _get_model_args(self) -> list[str]:
-        """Get model-related command line arguments."""
-        if self.model_path:
-            return ["--model", self.model_path]
-        return ["--model", self.voice]
+    def _availability_key(self) -> Optional[str]:
+        """Identify the piper binary by path and mtime; None if it can't be found."""
+        binary = shutil.which(self.piper_path)
+        if not binary:
+            return None
+        try:
+            return f"{binary}:{os.stat(binary).st_mtime_ns}"
+        except OSError:
+            return None
+
+    def _read_availability(self, key: Optional[str]) -> Optional[bool]:
+        if not key:
+            return None
+        try:
+            return json.loads(AVAILABILITY_FILE.read_text()).get(key)
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def _write_availability(self, key: str, available: bool) -> None:
+        try:
+            entries = json.loads(AVAILABILITY_FILE.read_text())
+        except (OSError, ValueError):
+            entries = {}
+        if not isinstance(entries, dict):
+            entries = {}
+        entries[key] = available
+        try:
+            AVAILABILITY_FILE.parent.mkdir(parents=True, exist_ok=True)
+            AVAILABILITY_FILE.write_text(json.dumps(entries))
+        except OSError as e:
+            logger.debug(f"Could not write Piper availability cache: {e}")
 
     def synthesize_to_file(
         self,
@@ -99,6 +408,156 @@ class PiperTTSClient:
         Returns:
             Path to the output file
 
+        Raises:
+            PiperTTSError: If synthesis fails
+        """
+        if self._get_voice() is not None:
+            # In-process synthesis; there may be no piper binary at all
+            audio = self.synthesize_to_bytes(text, rate)
+            with open(filepath, "wb") as f:
+                f.write(audio)
+            return filepath
+
+        self._run_piper(["--output_file", filepath], text, rate)
+        return filepath
+
+    def _get_worker(self, rate: Optional[float]) -> Optional[_PiperWorker]:
+        """Get (or start) the persistent piper process for this rate."""
+        with self._workers_lock:
+            worker = self._workers.get(rate)
+            if worker is not None and worker.alive():
+                return worker
+            if worker is None and len(self._workers) >= MAX_PIPER_WORKERS:
+                return None
+            if worker is not None:
+                # Exited on its own; reap it before starting the replacement
+                del self._workers[rate]
+                worker.close()
+
+            cmd = self._base_cmd.copy()
+            if rate:
+                cmd.extend(["--length_scale", str(1.0 / rate)])
+            try:
+                worker = _PiperWorker(cmd)
+            except OSError as e:
+                logger.warning(f"Could not start persistent Piper process: {e}")
+                return None
+            self._workers[rate] = worker
+            return worker
+
+    def _has_voice_model(self) -> bool:
+        """Can synthesis run in-process (piper-tts installed, model file present)?"""
+        return bool(PIPER_PYTHON_AVAILABLE and self.model_path and os.path.isfile(self.model_path))
+
+    def _get_voice(self):
+        """Get the process-wide piper-tts voice for this model; None if it can't be used."""
+        if self._voice_loaded:
+            return self._voice
+        with self._voice_lock:
+            if not self._voice_loaded:
+                if self._has_voice_model():
+                    self._voice = self._load_shared_voice(self.model_path, self._use_cuda())
+                self._voice_loaded = True
+        return self._voice
+
+    @staticmethod
+    def _load_shared_voice(model_path: str, use_cuda: bool):
+        """Load a voice once per process, so pooled clients share one ONNX session."""
+        key = (os.path.abspath(model_path), use_cuda)
+        with _voices_lock:
+            if key not in _voices:
+                try:
+                    _voices[key] = PiperVoice.load(model_path, use_cuda=use_cuda)
+                except Exception as e:
+                    logger.warning(f"Could not load Piper voice in-process: {e}")
+                    _voices[key] = None
+            return _voices[key]
+
+    def _use_cuda(self) -> bool:
+        """Run the in-process voice on the CUDA execution provider?"""
+        if self.device == "cpu":
+            return False
+        try:
+            import onnxruntime
+            has_cuda = "CUDAExecutionProvider" in onnxruntime.get_available_providers()
+        except ImportError:
+            has_cuda = False
+        if self.device == "cuda" and not has_cuda:
+            logger.warning("CUDA requested for Piper but onnxruntime has no CUDA provider")
+        return has_cuda
+
+    def _synthesize_in_process(self, voice, text: str, rate: Optional[float]) -> bytes:
+        """Synthesize WAV bytes with the piper-tts package."""
+        length_scale = 1.0 / rate if rate else None
+        buffer = io.BytesIO()
+        try:
+            with wave.open(buffer, "wb") as wf:
+                if hasattr(voice, "synthesize_wav"):  # piper-tts >= 1.3
+                    from piper import SynthesisConfig
+                    voice.synthesize_wav(text, wf, syn_config=SynthesisConfig(length_scale=length_scale))
+                else:
+                    voice.synthesize(text, wf, length_scale=length_scale)
+        except Exception as e:
+            raise PiperTTSError(f"Piper synthesis error: {e}")
+        return buffer.getvalue()
+
+    def _synthesize(self, text: str, rate: Optional[float] = None) -> bytes:
+        """
+        Synthesize WAV bytes in-process when piper-tts is installed,
+        otherwise on a persistent piper process, or a one-shot one.
+        """
+        if not self.is_available():
+            raise PiperTTSError("Piper TTS is not available")
+
+        voice = self._get_voice()
+        if voice is not None:
+            return self._synthesize_in_process(voice, text, rate)
+
+        worker = self._get_worker(rate)
+        if worker is not None:
+            try:
+                return worker.synthesize(text)
+            except (OSError, PiperTTSError) as e:
+                logger.warning(f"Persistent Piper process failed, running one-shot: {e}")
+                self._drop_worker(rate, worker)
+        return self._synthesize_to_stdout(text, rate)
+
+    def _drop_worker(self, rate: Optional[float], worker: _PiperWorker) -> None:
+        """Forget a failed worker so the next request at this rate starts a fresh one."""
+        with self._workers_lock:
+            if self._workers.get(rate) is worker:
+                del self._workers[rate]
+        worker.kill()
+
+    def close(self) -> None:
+        """Stop the persistent piper processes."""
+        with self._workers_lock:
+            workers, self._workers = self._workers, {}
+        for worker in workers.values():
+            worker.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _synthesize_to_stdout(self, text: str, rate: Optional[float] = None) -> bytes:
+        """Synthesize text and collect the WAV from piper's stdout."""
+        return self._run_piper(["--output_file", "-"], text, rate)
+
+    def _run_piper(self, output_args: list[str], text: str, rate: Optional[float]) -> bytes:
+        """
+        Run one piper process over text.
+
+        Args:
+            output_args: Output-selection arguments for piper
+            text: Text to synthesize
+            rate: Speech rate multiplier (optional)
+
+        Returns:
+            Whatever piper wrote to stdout
+
         Raises:
             PiperTTSError: If synthesis fails
         """
@@ -106,9 +565,8 @@ class PiperTTSClient:
             raise PiperTTSError("Piper TTS is not available")
 
         try:
-            cmd = [self.piper_path]
-            cmd.extend(self._get_model_args())
-            cmd.extend(["--output_file", filepath])
+            cmd = self._base_cmd.copy()
+            cmd.extend(output_args)
 
             if rate:
                 cmd.extend(["--length_scale", str(1.0 / rate)])
@@ -117,10 +575,40 @@ class PiperTTSClient:
                 cmd,
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
+                stderr=subprocess.PIPE,
+                bufsize=0,
+                **_pipe_size_kwargs()
             )
+            _grow_pipe(process.stdout)
+
+            # stdin is fed and stderr drained from threads so neither pipe
+            # can deadlock against a full stdout; the timer enforces the timeout
+            stderr_chunks: list[bytes] = []
+            helpers = [
+                threading.Thread(
+                    target=self._feed_stdin, args=(process.stdin, text.encode("utf-8")), daemon=True
+                ),
+                threading.Thread(
+                    target=self._drain, args=(process.stderr, stderr_chunks), daemon=True
+                ),
+            ]
+            timer = threading.Timer(30, process.kill)
+            for helper in helpers:
+                helper.start()
+            timer.start()
+            try:
+                # One immutable copy: the result is cached and shared
+                stdout = bytes(_read_all_into(process.stdout))
+                process.wait()
+            finally:
+                timed_out = not timer.is_alive()
+                timer.cancel()
+                for helper in helpers:
+                    helper.join()
+            stderr = b"".join(stderr_chunks)
 
-            stdout, stderr = process.communicate(input=text.encode("utf-8"), timeout=30)
+            if timed_out:
+                raise PiperTTSError("Piper synthesis timed out")
 
             if process.returncode != 0:
                 raise PiperTTSError(
@@ -128,14 +616,40 @@ class PiperTTSClient:
                     details=stderr.decode("utf-8", errors="replace")
                 )
 
-            return filepath
+            return stdout
 
-        except subprocess.TimeoutExpired:
-            process.kill()
-            raise PiperTTSError("Piper synthesis timed out")
+        except PiperTTSError:
+            raise
         except Exception as e:
             raise PiperTTSError(f"Piper synthesis error: {e}")
 
+    @staticmethod
+    def _feed_stdin(pipe, data: bytes) -> None:
+        view = memoryview(data)
+        try:
+            while view:
+                view = view[pipe.write(view):]
+        except (BrokenPipeError, OSError):
+            pass
+        finally:
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+    @staticmethod
+    def _drain(pipe, sink: list) -> None:
+        try:
+            while True:
+                chunk = pipe.read(65536)
+                if not chunk:
+                    break
+                sink.append(chunk)
+        except OSError:
+            pass
+        finally:
+            pipe.close()
+
     def synthesize_to_bytes(
         self,
         text: str,
@@ -154,16 +668,102 @@ class PiperTTSClient:
         Raises:
             PiperTTSError: If synthesis fails
         """
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            temp_path = f.name
+        key = hashlib.sha256(f"{self.voice}|{self.model_path}|{rate}|{text}".encode("utf-8")).hexdigest()
 
+        audio = self._get_cached_audio(key)
+        if audio is None:
+            audio = self._synthesize(text, rate)
+            self._cache_audio(key, audio)
+        return audio
+
+    def _get_cached_audio(self, key: str) -> Optional[bytes]:
+        """Look up cached WAV bytes in memory, then on disk."""
+        with self._cache_lock:
+            audio = self._audio_cache.get(key)
+            if audio is not None:
+                self._audio_cache.move_to_end(key)
+                return audio
+
+        if not self.disk_cache:
+            return None
+        path = AUDIO_CACHE_DIR / f"{key}.wav"
         try:
-            self.synthesize_to_file(text, temp_path, rate=rate)
-            with open(temp_path, "rb") as f:
-                return f.read()
-        finally:
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+            audio = path.read_bytes()
+            # Mark as recently used for pruning
+            os.utime(path)
+        except OSError:
+            return None
+        self._remember_audio(key, audio)
+        return audio
+
+    def _cache_audio(self, key: str, audio: bytes) -> None:
+        """Store WAV bytes in memory, and on disk when the disk tier is enabled."""
+        self._remember_audio(key, audio)
+        if not self.disk_cache:
+            return
+        try:
+            AUDIO_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write under a temporary name so readers never see a partial file
+            partial = AUDIO_CACHE_DIR / f"{key}.{threading.get_ident()}.part"
+            partial.write_bytes(audio)
+            os.replace(partial, AUDIO_CACHE_DIR / f"{key}.wav")
+        except OSError as e:
+            logger.debug(f"Could not write Piper audio cache: {e}")
+            return
+
+        with self._cache_lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._disk_usage()
+            else:
+                self._disk_bytes += len(audio)
+            if self._disk_bytes > AUDIO_DISK_CACHE_MAX_BYTES:
+                self._disk_bytes = self._prune_disk_cache()
+
+    @staticmethod
+    def _disk_usage() -> int:
+        total = 0
+        for path in AUDIO_CACHE_DIR.glob("*.wav"):
+            try:
+                total += path.stat().st_size
+            except OSError:
+                pass
+        return total
+
+    @staticmethod
+    def _prune_disk_cache() -> int:
+        """Delete least recently used files down to 3/4 of the cap; returns bytes kept."""
+        files = []
+        for path in AUDIO_CACHE_DIR.glob("*.wav"):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            files.append((st.st_mtime, st.st_size, path))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        target = AUDIO_DISK_CACHE_MAX_BYTES * 3 // 4
+        for _, size, path in files:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        return total
+
+    def _remember_audio(self, key: str, audio: bytes) -> None:
+        with self._cache_lock:
+            self._audio_cache[key] = audio
+            self._audio_cache.move_to_end(key)
+            while len(self._audio_cache) > AUDIO_CACHE_SIZE:
+                self._audio_cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        """Drop all cached audio, in memory and on disk."""
+        with self._cache_lock:
+            self._audio_cache.clear()
+            self._disk_bytes = None
+        for path in AUDIO_CACHE_DIR.glob("*.wav"):
+            path.unlink(missing_ok=True)
 
     def speak(
         self,
@@ -185,61 +785,98 @@ class PiperTTSClient:
         if not self.is_available():
             raise PiperTTSError("Piper TTS is not available")
 
+        self._play_wav(self.synthesize_to_bytes(text, rate=rate))
+
+    def _play_wav(self, audio_bytes: bytes) -> None:
+        """Play WAV bytes through sounddevice, or a system player without it."""
+        self._play_wavs([audio_bytes])
+
+    def _play_wavs(
+        self,
+        wavs: Iterable[bytes],
+        on_start: Optional[Callable[[int], None]] = None,
+        on_complete: Optional[Callable[[int], None]] = None
+    ) -> None:
+        """
+        Play WAVs back to back on one raw output stream.
+
+        Each WAV's samples are written straight from its buffer as soon
+        as it arrives, so the first plays while later ones are still
+        being synthesized and the device is not reopened between them.
+        """
+        if not SOUNDDEVICE_AVAILABLE:
+            logger.warning("sounddevice not available, falling back to system player")
+            for i, audio_bytes in enumerate(wavs):
+                if on_start:
+                    on_start(i)
+                self._play_with_system(audio_bytes)
+                if on_complete:
+                    on_complete(i)
+            return
+
+        stream = None
         try:
-            # Try to use sounddevice for playback
-            import sounddevice as sd
-            import numpy as np
+            for i, audio_bytes in enumerate(wavs):
+                pcm, sample_rate, n_channels = _wav_pcm(audio_bytes)
 
-            audio_bytes = self.synthesize_to_bytes(text, rate=rate)
+                if stream is None or stream.samplerate != sample_rate or stream.channels != n_channels:
+                    if stream is not None:
+                        stream.stop()
+                        stream.close()
+                    dtype = self._output_dtype(sample_rate, n_channels)
+                    stream = sd.RawOutputStream(samplerate=sample_rate, channels=n_channels, dtype=dtype)
+                    stream.start()
 
-            # Parse WAV data
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                f.write(audio_bytes)
-                temp_path = f.name
+                if stream.dtype == "float32":
+                    pcm = self._to_float32(pcm)
 
+                if on_start:
+                    on_start(i)
+                stream.write(pcm)
+                if on_complete:
+                    on_complete(i)
+        finally:
+            if stream is not None:
+                # stop() lets the queued audio finish playing
+                stream.stop()
+                stream.close()
+
+    def _output_dtype(self, sample_rate: int, n_channels: int) -> str:
+        """Pick int16 output if the default device takes it, else float32; probed once."""
+        if self._play_dtype is None:
             try:
-                with wave.open(temp_path, "rb") as wf:
-                    sample_rate = wf.getframerate()
-                    n_channels = wf.getnchannels()
-                    audio_data = wf.readframes(wf.getnframes())
-
-                # Convert to numpy array
-                audio_array = np.frombuffer(audio_data, dtype=np.int16)
-                if n_channels > 1:
-                    audio_array = audio_array.reshape(-1, n_channels)
-
-                # Play audio
-                sd.play(audio_array, sample_rate)
-                sd.wait()
-            finally:
-                os.unlink(temp_path)
+                sd.check_output_settings(samplerate=sample_rate, channels=n_channels, dtype="int16")
+                self._play_dtype = "int16"
+            except Exception:
+                self._play_dtype = "float32"
+        return self._play_dtype
 
-        except ImportError:
-            logger.warning("sounddevice not available, falling back to system player")
-            self._play_with_system(text, rate)
+    def _to_float32(self, pcm: memoryview) -> memoryview:
+        """Scale int16 PCM into the reused float32 buffer."""
+        samples = np.frombuffer(pcm, dtype=np.int16)
+        if self._play_buffer is None or self._play_buffer.size < samples.size:
+            self._play_buffer = np.empty(samples.size, dtype=np.float32)
+        out = self._play_buffer[:samples.size]
+        np.multiply(samples, np.float32(1 / 32768), out=out)
+        return memoryview(out).cast("B")
 
-    def _play_with_system(self, text: str, rate: Optional[float] = None) -> None:
-        """Play audio using system audio player."""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
+    def _play_with_system(self, audio_bytes: bytes) -> None:
+        """Play WAV bytes using system audio player."""
+        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False, dir=TEMP_AUDIO_DIR) as f:
+            f.write(audio_bytes)
             temp_path = f.name
 
         try:
-            self.synthesize_to_file(text, temp_path, rate=rate)
-
-            # Try different system players
             if os.name == "nt":  # Windows
                 os.startfile(temp_path)
-            elif os.name == "posix":
-                for player in ["aplay", "paplay", "afplay"]:
-                    try:
-                        subprocess.run([player, temp_path], check=True)
-                        break
-                    except (subprocess.SubprocessError, FileNotFoundError):
-                        continue
+            elif self._sys_player:
+                subprocess.run([self._sys_player, temp_path], check=False)
+            else:
+                logger.warning("No system audio player found")
         finally:
             # Note: File might still be playing, so we don't delete immediately on Windows
-            if os.name != "nt" and os.path.exists(temp_path):
-                os.unlink(temp_path)
+            if os.name != "nt":
+                Path(temp_path).unlink(missing_ok=True)
 
     def speak_with_llm_params(
         self,
@@ -269,6 +906,34 @@ class PiperTTSClient:
 
         self.speak(text, rate=rate_float)
 
+    def _split_sentences(self, text: str) -> list[str]:
+        """
+        Split text into sentences for chunked synthesis.
+
+        Uses ICU's sentence rules for the voice's locale (abbreviations
+        such as "Dr." and non-Latin punctuation are handled) when PyICU
+        is installed, otherwise the punctuation regex.
+        """
+        text = text.strip()
+        if not ICU_AVAILABLE:
+            pieces = _SENT_SPLIT_RE.split(text)
+        else:
+            # ICU offsets are UTF-16 based, so slice an ICU string
+            utext = icu.UnicodeString(text)
+            with self._splitter_lock:
+                if self._splitter is None:
+                    locale = icu.Locale(f"{self._voice_locale()}@ss=standard")
+                    self._splitter = icu.BreakIterator.createSentenceInstance(locale)
+                self._splitter.setText(utext)
+                bounds = [self._splitter.first()] + list(self._splitter)
+            pieces = [str(utext[start:end]) for start, end in zip(bounds, bounds[1:])]
+        return [piece.strip() for piece in pieces if piece.strip()]
+
+    def _voice_locale(self) -> str:
+        """Locale of the voice, from its name (e.g. en_US-lessac-medium -> en_US)."""
+        name = Path(self.model_path).name if self.model_path else self.voice
+        return name.split("-", 1)[0] or "en_US"
+
     def speak_chunked(
         self,
         text: str,
@@ -276,22 +941,24 @@ class PiperTTSClient:
         pitch: Optional[str] = None,
         rate: Optional[str] = None,
         on_sentence_start: Optional[Callable[[str, int], None]] = None,
-        on_sentence_complete: Optional[Callable[[int], None]] = None
+        on_sentence_complete: Optional[Callable[[int], None]] = None,
+        tts_concurrency: int = DEFAULT_TTS_CONCURRENCY
     ) -> None:
         """
         Synthesize text sentence-by-sentence.
 
+        Later sentences are synthesized while earlier ones play.
+
         Args:
             text: Full text to synthesize
             style: Ignored (for API compatibility)
             pitch: Ignored (for API compatibility)
             rate: Speech rate
-            on_sentence_start: Callback when sentence synthesis starts
+            on_sentence_start: Callback when a sentence starts playing
             on_sentence_complete: Callback when sentence completes
+            tts_concurrency: Sentences synthesized ahead of playback
         """
-        import re
-        sentences = re.split(r'(?<=[.!?])\s+', text.strip())
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = self._split_sentences(text)
 
         rate_float = None
         if rate:
@@ -300,37 +967,68 @@ class PiperTTSClient:
             except ValueError:
                 pass
 
-        for i, sentence in enumerate(sentences):
-            if on_sentence_start:
-                on_sentence_start(sentence, i)
+        if sentences and not self.is_available():
+            raise PiperTTSError("Piper TTS is not available")
+
+        self._play_wavs(
+            self._synthesize_ahead(sentences, rate_float, tts_concurrency),
+            on_start=(lambda i: on_sentence_start(sentences[i], i)) if on_sentence_start else None,
+            on_complete=on_sentence_complete
+        )
 
-            self.speak(sentence, rate=rate_float)
+    async def aspeak_chunked(
+        self,
+        text: str,
+        style: Optional[str] = None,
+        pitch: Optional[str] = None,
+        rate: Optional[str] = None,
+        on_sentence_start: Optional[Callable[[str, int], None]] = None,
+        on_sentence_complete: Optional[Callable[[int], None]] = None,
+        tts_concurrency: int = DEFAULT_TTS_CONCURRENCY
+    ) -> None:
+        """
+        Async speak_chunked: synthesis and playback run on worker threads.
 
-            if on_sentence_complete:
-                on_sentence_complete(i)
+        The event loop stays free while the reply is spoken; wrap the call
+        in a task to keep generating text meanwhile. Callbacks are invoked
+        from the playback thread.
+        """
+        await asyncio.to_thread(
+            self.speak_chunked,
+            text,
+            style=style,
+            pitch=pitch,
+            rate=rate,
+            on_sentence_start=on_sentence_start,
+            on_sentence_complete=on_sentence_complete,
+            tts_concurrency=tts_concurrency
+        )
 
     def synthesize_chunks_generator(
         self,
         text: str,
         style: Optional[str] = None,
         pitch: Optional[str] = None,
-        rate: Optional[str] = None
+        rate: Optional[str] = None,
+        tts_concurrency: int = DEFAULT_TTS_CONCURRENCY
     ) -> Generator[bytes, None, None]:
         """
         Generate audio chunks for each sentence.
 
+        Up to tts_concurrency sentences are synthesized ahead of the
+        consumer; chunks are still yielded in sentence order.
+
         Args:
             text: Full text to synthesize
             style: Ignored (for API compatibility)
             pitch: Ignored (for API compatibility)
             rate: Speech rate
+            tts_concurrency: Sentences synthesized ahead of the consumer
 
         Yields:
             Audio bytes for each sentence
         """
-        import re
-        sentences = re.split(r'(?<=[.!?])\s+', text.strip())
-        sentences = [s.strip() for s in sentences if s.strip()]
+        sentences = self._split_sentences(text)
 
         rate_float = None
         if rate:
@@ -339,6 +1037,58 @@ class PiperTTSClient:
             except ValueError:
                 pass
 
-        for sentence in sentences:
-            audio_bytes = self.synthesize_to_bytes(sentence, rate=rate_float)
-            yield audio_bytes
+        yield from self._synthesize_ahead(sentences, rate_float, tts_concurrency)
+
+    def synthesize_pcm_chunks(
+        self,
+        text: str,
+        rate: Optional[str] = None,
+        tts_concurrency: int = DEFAULT_TTS_CONCURRENCY
+    ) -> Generator[tuple[int, np.ndarray], None, None]:
+        """
+        Generate raw PCM for each sentence.
+
+        Like synthesize_chunks_generator, but each chunk is the sample
+        rate and an int16 array viewing the samples (shape (n,) or
+        (n, channels)), so consumers can stitch audio without parsing
+        WAV headers.
+
+        Args:
+            text: Full text to synthesize
+            rate: Speech rate
+            tts_concurrency: Sentences synthesized ahead of the consumer
+
+        Yields:
+            (sample_rate, samples) for each sentence
+        """
+        for audio_bytes in self.synthesize_chunks_generator(text, rate=rate, tts_concurrency=tts_concurrency):
+            pcm, sample_rate, n_channels = _wav_pcm(audio_bytes)
+            samples = np.frombuffer(pcm, dtype=np.int16)
+            if n_channels > 1:
+                samples = samples.reshape(-1, n_channels)
+            yield sample_rate, samples
+
+    def _synthesize_ahead(
+        self,
+        sentences: list[str],
+        rate: Optional[float],
+        concurrency: int
+    ) -> Generator[bytes, None, None]:
+        """Synthesize sentences on a thread pool, yielding WAV bytes in order."""
+        if not sentences:
+            return
+
+        pool = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="piper")
+        remaining = iter(sentences)
+        pending = deque(
+            pool.submit(self.synthesize_to_bytes, sentence, rate)
+            for sentence in islice(remaining, max(1, concurrency))
+        )
+        try:
+            while pending:
+                audio_bytes = pending.popleft().result()
+                for sentence in islice(remaining, 1):
+                    pending.append(pool.submit(self.synthesize_to_bytes, sentence, rate))
+                yield audio_bytes
+        finally:
+            pool.shutdown(wait=False, cancel_futures=True)
@@ -6,6 +6,7 @@ Supports express-as styles, prosody control, and emphasis tags.
 """
 
 from dataclasses import dataclass
+from html import escape
 from typing import Optional
 from enum import Enum
 
@@ -69,6 +70,15 @@ AZURE_EXPRESS_STYLES = {
 }
 
 
+# Compact SSML envelope used by SSMLBuilder.build_ssml_fast
+_SSML_PREFIX_TEMPLATE = (
+    '<speak version="1.0" xmlns="http://www.w3.org/2001/10/synthesis" '
+    'xmlns:mstts="https://www.w3.org/2001/mstts" xml:lang="en-US">'
+    '<voice name="{voice}">'
+)
+_SSML_SUFFIX = "</voice></speak>"
+
+
 @dataclass
 class ProsodySettings:
     """Prosody settings for speech synthesis."""
@@ -138,6 +148,9 @@ class SSMLBuilder:
         else:
             self.voice = self.DEFAULT_MALE_VOICE if voice_gender == "male" else self.DEFAULT_FEMALE_VOICE
 
+        # SSML envelope per voice; voice may be switched after creation
+        self._ssml_prefixes: dict[str, str] = {}
+
     def build(
         self,
         text: str,
@@ -228,6 +241,50 @@ class SSMLBuilder:
             styledegree=styledegree
         )
 
+    def build_ssml_fast(
+        self,
+        text: str,
+        style: Optional[str] = None,
+        pitch: Optional[str] = None,
+        rate: Optional[str] = None,
+        voice: Optional[str] = None
+    ) -> str:
+        """
+        Build SSML for plain reply text.
+
+        Same markup as build_from_llm_response, but the speak/voice
+        envelope is built once per voice and the text is XML-escaped,
+        so it must not contain SSML tags.
+
+        Args:
+            text: The reply text from LLM
+            style: Style from LLM (e.g., "empathetic", "cheerful")
+            pitch: Pitch from LLM (e.g., "-5%")
+            rate: Rate from LLM (e.g., "0.85")
+            voice: Voice for this call only (defaults to self.voice)
+
+        Returns:
+            Complete SSML string for Azure TTS
+        """
+        settings = PROSODY_PROFILES[self._style_to_profile(style)]
+        final_pitch = pitch if pitch is not None else settings.pitch
+        final_rate = rate if rate is not None else settings.rate
+        final_style = style if style is not None else settings.style
+
+        content = self._build_prosody(escape(text, quote=False), final_pitch, final_rate, settings.volume)
+        if final_style:
+            content = self._wrap_express_as(
+                content,
+                final_style,
+                styledegree=self._get_default_styledegree(style)
+            )
+
+        voice = voice or self.voice
+        prefix = self._ssml_prefixes.get(voice)
+        if prefix is None:
+            prefix = self._ssml_prefixes[voice] = _SSML_PREFIX_TEMPLATE.format(voice=voice)
+        return prefix + content + _SSML_SUFFIX
+
     def _get_default_styledegree(self, style: Optional[str]) -> Optional[float]:
         """
         Get default styledegree based on emotion/style.